@@ -77,7 +77,7 @@ from utils.live_message import (
     schedule_live_message_update,
     initialize_live_message_scheduler,
 )
-from utils.bet_state import BetState
+from utils.bet_state import BetState, bet_is_on, find_contestant_id
 from utils.bet_state import WinnerInfo
 
 
@@ -508,6 +508,11 @@ class Betting(commands.Cog):
                 f"🔍 DEFERRED: Error processing deferred reaction for user {user_id}: {e}"
             )
 
+    def _get_bet_state(self, data: Data) -> BetState:
+        """Returns the cog's cached BetState pointed at ``data``."""
+        self.bet_state.update_data(data)
+        return self.bet_state
+
     async def _check_permission(self, ctx: commands.Context, action: str) -> bool:
         """Centralized permission check for betting actions."""
         return await BettingPermissions.check_permission(ctx, action)
@@ -527,16 +532,21 @@ class Betting(commands.Cog):
             return None
 
         input_lower = input_name.lower().strip()
+        # Lowercase each name once for all three matching passes
+        lowered = [
+            (contestant_id, name, name.lower())
+            for contestant_id, name in contestants.items()
+        ]
 
         # First try exact match (case insensitive)
-        for contestant_id, name in contestants.items():
-            if name.lower() == input_lower:
+        for contestant_id, name, name_lower in lowered:
+            if name_lower == input_lower:
                 return contestant_id, name
 
         # Then try partial match (starts with)
         matches = []
-        for contestant_id, name in contestants.items():
-            if name.lower().startswith(input_lower):
+        for contestant_id, name, name_lower in lowered:
+            if name_lower.startswith(input_lower):
                 matches.append((contestant_id, name))
 
         # If exactly one partial match, use it
@@ -545,8 +555,8 @@ class Betting(commands.Cog):
 
         # Try contains match if no partial matches
         if not matches:
-            for contestant_id, name in contestants.items():
-                if input_lower in name.lower():
+            for contestant_id, name, name_lower in lowered:
+                if input_lower in name_lower:
                     matches.append((contestant_id, name))
 
         # If exactly one contains match, use it
@@ -861,7 +871,7 @@ class Betting(commands.Cog):
 
             # Use BetState to handle bet placement which will handle refunds and
             # balance updates
-            bet_state = BetState(data)
+            bet_state = self._get_bet_state(data)
             self._log_reaction_debug(
                 f"🔍 PROCESS BET: Calling bet_state.place_bet({user_id}, {amount}, {contestant_name}, {emoji})"
             )
@@ -952,12 +962,10 @@ class Betting(commands.Cog):
             c2_emojis[3],  # Second contestant, 1000 coins (👑)
         ]
 
-        # Add reactions with proper spacing to avoid rate limits
-        for i, emoji in enumerate(priority_order):
+        # Add reactions one at a time so they keep this order. discord.py's
+        # route rate limiter paces the requests, so no fixed delay is needed.
+        for emoji in priority_order:
             await self._add_single_reaction_with_retry(message, emoji)
-            # Small delay between reactions (Discord limit: ~1 per 0.25s)
-            if i < len(priority_order) - 1:
-                await asyncio.sleep(0.3)
 
     async def _add_single_reaction_with_retry(
         self, message: discord.Message, emoji: str, max_retries: int = 2
@@ -1011,43 +1019,57 @@ class Betting(commands.Cog):
             f"🔍 REMOVE REACTIONS: All betting emojis: {all_betting_emojis}"
         )
 
+        emojis_to_remove = []
         for emoji_str in all_betting_emojis:
             if emoji_str == exclude_emoji:
                 self._log_reaction_debug(
                     f"🔍 REMOVE REACTIONS: Skipping removal of exclude_emoji: {emoji_str}"
                 )
                 continue  # Skip the emoji that was just added
+            emojis_to_remove.append(emoji_str)
 
-            try:
-                # Mark this removal as programmatic to prevent race condition
-                self._mark_programmatic_removal(message.id, user.id, emoji_str)
-                self._log_reaction_debug(
-                    f"🔍 REMOVE REACTIONS: Removing reaction: {emoji_str}"
-                )
-                await message.remove_reaction(emoji_str, user)
-                self._log_reaction_debug(
-                    f"🔍 REMOVE REACTIONS: Successfully removed reaction: {emoji_str}"
-                )
-            except discord.NotFound:
-                self._log_reaction_debug(
-                    f"🔍 REMOVE REACTIONS: Reaction {emoji_str} not found for user {
-                        user.name}, skipping"
-                )
-                # Remove the mark since the removal didn't happen
-                self._is_programmatic_removal(message.id, user.id, emoji_str)
-            except discord.HTTPException as e:
-                # Remove the mark since the removal failed
-                self._is_programmatic_removal(message.id, user.id, emoji_str)
-                self._log_reaction_debug(
-                    f"🔍 REMOVE REACTIONS: Failed to remove reaction {emoji_str} from user {
-                        user.name}: {e}"
-                )
+        # Each emoji is its own route, so the removals can run concurrently
+        await asyncio.gather(
+            *(
+                self._remove_single_reaction(message, user, emoji_str)
+                for emoji_str in emojis_to_remove
+            )
+        )
 
         self._log_reaction_debug(
             f"🔍 REMOVE REACTIONS: Cleanup complete for user {
                 user.id}"
         )
 
+    async def _remove_single_reaction(
+        self, message: discord.Message, user: discord.abc.User, emoji_str: str
+    ) -> None:
+        """Removes one betting reaction, marking it as programmatic first."""
+        try:
+            # Mark this removal as programmatic to prevent race condition
+            self._mark_programmatic_removal(message.id, user.id, emoji_str)
+            self._log_reaction_debug(
+                f"🔍 REMOVE REACTIONS: Removing reaction: {emoji_str}"
+            )
+            await message.remove_reaction(emoji_str, user)
+            self._log_reaction_debug(
+                f"🔍 REMOVE REACTIONS: Successfully removed reaction: {emoji_str}"
+            )
+        except discord.NotFound:
+            self._log_reaction_debug(
+                f"🔍 REMOVE REACTIONS: Reaction {emoji_str} not found for user {
+                    user.name}, skipping"
+            )
+            # Remove the mark since the removal didn't happen
+            self._is_programmatic_removal(message.id, user.id, emoji_str)
+        except discord.HTTPException as e:
+            # Remove the mark since the removal failed
+            self._is_programmatic_removal(message.id, user.id, emoji_str)
+            self._log_reaction_debug(
+                f"🔍 REMOVE REACTIONS: Failed to remove reaction {emoji_str} from user {
+                    user.name}: {e}"
+            )
+
     async def _remove_old_reaction_bet(
         self, data: Data, user_id: str, old_emoji: str
     ) -> None:
@@ -1182,22 +1204,22 @@ class Betting(commands.Cog):
                 COLOR_SUCCESS,
             )
             # Reset betting state even with no bets
-            self.bet_state.update_data(data)
-            self.bet_state.declare_winner(winner_name)
+            self._get_bet_state(data).declare_winner(winner_name)
             return
 
         # Calculate statistics BEFORE processing winner (which clears bet data)
         total_bettors = len(data["betting"]["bets"])
         total_pot = sum(bet["amount"] for bet in data["betting"]["bets"].values())
+        winner_lower = winner_name.lower()
+        winner_id = find_contestant_id(data["betting"]["contestants"], winner_lower)
         bets_on_winner = sum(
             1
             for bet in data["betting"]["bets"].values()
-            if bet["choice"].lower() == winner_name.lower()
+            if bet_is_on(bet, winner_id, winner_lower)
         )
 
         # Process winner through BetState
-        self.bet_state.update_data(data)
-        winner_info = self.bet_state.declare_winner(winner_name)
+        winner_info = self._get_bet_state(data).declare_winner(winner_name)
 
         # Log winner declaration
         logger.info(
@@ -1321,6 +1343,7 @@ class Betting(commands.Cog):
             data
         )  # Clear timer_end_time when bets are locked
         save_data(data)
+        self.timer.notify_locked()
 
         lock_summary = MSG_BETTING_LOCKED_SUMMARY
         if timer_expired:
@@ -1341,8 +1364,7 @@ class Betting(commands.Cog):
             channel = self.bot.get_channel(chan_id)
             if channel and isinstance(channel, discord.TextChannel):
                 try:
-                    message = await channel.fetch_message(msg_id)
-                    await message.clear_reactions()
+                    await channel.get_partial_message(msg_id).clear_reactions()
                     print(
                         f"Cleared all reactions from live message {msg_id} in channel {chan_id}."
                     )
@@ -1430,7 +1452,7 @@ class Betting(commands.Cog):
             )
             return
 
-        clear_live_message_info(data)
+        clear_live_message_info(data, save=False)  # Saved with the new round
         self._cancel_bet_timer()
 
         data["betting"] = {
@@ -1894,7 +1916,7 @@ class Betting(commands.Cog):
 
         # Use BetState for proper balance validation (accounts for existing bet
         # refunds)
-        bet_state = BetState(data)
+        bet_state = self._get_bet_state(data)
         user_balance = bet_state.economy.get_balance(user_id_str)
         required_additional = amount - old_amount
 
@@ -2285,11 +2307,14 @@ class Betting(commands.Cog):
             return
 
         # Place the bet
-        data["betting"]["bets"][str(user.id)] = {
+        bet_record = {
             "amount": amount,
             "choice": contestant_name.lower(),
             "emoji": None,  # Manual bets do not have an associated emoji
         }
+        if contestant_id.isdigit():
+            bet_record["choice_id"] = int(contestant_id)
+        data["betting"]["bets"][str(user.id)] = bet_record
         data["balances"][str(user.id)] -= amount
         save_data(data)
 
@@ -3128,8 +3153,10 @@ class Betting(commands.Cog):
 
         contestant_stats = {}
         for contestant_key, contestant_name in contestants.items():
+            name_lower = contestant_name.lower()
+            c_id = find_contestant_id(contestants, name_lower)
             contestant_bets = [
-                bet for bet in bets.values() if bet["choice"] == contestant_name.lower()
+                bet for bet in bets.values() if bet_is_on(bet, c_id, name_lower)
             ]
             contestant_stats[contestant_name] = {
                 "bets": len(contestant_bets),
@@ -3265,8 +3292,10 @@ class Betting(commands.Cog):
         # Calculate payouts if there's a winner and bets exist
         if winner and bets:
             total_pot = sum(bet["amount"] for bet in bets.values())
+            winner_lower = winner.lower()
+            winner_id = find_contestant_id(contestants, winner_lower)
             winning_bets = [
-                bet for bet in bets.values() if bet["choice"] == winner.lower()
+                bet for bet in bets.values() if bet_is_on(bet, winner_id, winner_lower)
             ]
             winning_pot = sum(bet["amount"] for bet in winning_bets)
 
@@ -3274,9 +3303,9 @@ class Betting(commands.Cog):
             if winning_bets:
                 # Distribute winnings proportionally
                 for user_id, bet in bets.items():
-                    if bet["choice"] == winner.lower():
+                    if bet_is_on(bet, winner_id, winner_lower):
                         # Winner gets their share of the total pot
-                        winnings = int((bet["amount"] / winning_pot) * total_pot)
+                        winnings = bet["amount"] * total_pot // winning_pot
                         data["balances"][user_id] += winnings
 
             # Create results summary
@@ -8,6 +8,12 @@ load_dotenv()
 __version__ = "2.1.0"
 TOKEN = os.getenv("DISCORD_TOKEN")
 DATA_FILE = os.path.join(os.path.dirname(__file__), "data.json")
+
+# Storage backend for bot data: "json" (DATA_FILE, default), "memory"
+# (process-local, lost on restart) or "redis" (requires redis-py + REDIS_URL)
+DATA_STORE_BACKEND = os.getenv("DATA_STORE_BACKEND", "json")
+REDIS_URL = os.getenv("REDIS_URL")
+REDIS_KEY_PREFIX = os.getenv("REDIS_KEY_PREFIX", "betbot")
 STARTING_BALANCE = 10_000
 
 # New: Betting Timer Configuration
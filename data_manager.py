@@ -1,8 +1,12 @@
 import json
 import os
+from abc import ABC, abstractmethod
 from typing import Dict, Any, TypedDict, Optional, List, Tuple  # Added List for clarity
 from config import (
     DATA_FILE,
+    DATA_STORE_BACKEND,
+    REDIS_URL,
+    REDIS_KEY_PREFIX,
     STARTING_BALANCE,
     ENABLE_BET_TIMER_DEFAULT,
     REACTION_BET_AMOUNTS,
@@ -103,12 +107,209 @@ class Data(TypedDict):
     multi_session_mode: bool  # Enable multi-session features
 
 
+# ---------- Storage Backends ----------
+class SessionStore(ABC):
+    """Persistence backend for the bot's data document.
+
+    ``read``/``write`` move the whole document; backends that can store it
+    in pieces are expected to only send what changed on ``write``.
+    """
+
+    @abstractmethod
+    def read(self) -> Optional[Dict[str, Any]]:
+        """Return the stored document, or None if nothing has been saved yet."""
+
+    @abstractmethod
+    def write(self, data: Dict[str, Any]) -> None:
+        """Persist the full document."""
+
+
+class JsonSessionStore(SessionStore):
+    """Stores the document in a JSON file (default backend).
+
+    The JSON text last read or written is kept in memory together with the
+    file's stat signature. While the file is unchanged, reads parse that
+    text instead of opening the file again; an edit made outside the bot
+    changes the signature and forces a fresh read. Every read returns a new
+    document, so unsaved changes never leak into later reads.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        # None means "use DATA_FILE", resolved on each call so tests can
+        # repoint data_manager.DATA_FILE at runtime.
+        self.path = path
+        # (path, mtime_ns, size, JSON text) for the last read/write
+        self._cache: Optional[Tuple[str, int, int, str]] = None
+
+    def _path(self) -> str:
+        return self.path or DATA_FILE
+
+    def _remember(self, path: str, text: str) -> None:
+        st = os.stat(path)
+        self._cache = (path, st.st_mtime_ns, st.st_size, text)
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        path = self._path()
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._cache = None
+            return None
+
+        if self._cache is not None and self._cache[:3] == (
+            path,
+            st.st_mtime_ns,
+            st.st_size,
+        ):
+            return json.loads(self._cache[3])
+
+        with open(path, "r", encoding="utf-8") as f:
+            text = f.read()
+        data = json.loads(text)
+        self._remember(path, text)
+        return data
+
+    def write(self, data: Dict[str, Any]) -> None:
+        path = self._path()
+        text = json.dumps(data, indent=4, ensure_ascii=False)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        self._remember(path, text)
+
+
+class MemorySessionStore(SessionStore):
+    """Keeps the document in process memory (tests and local development)."""
+
+    def __init__(self):
+        self._data: Optional[str] = None
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        if self._data is None:
+            return None
+        # Hand out a fresh copy so callers behave the same as with JSON files
+        return json.loads(self._data)
+
+    def write(self, data: Dict[str, Any]) -> None:
+        self._data = json.dumps(data, ensure_ascii=False)
+
+
+class RedisSessionStore(SessionStore):
+    """Stores the document in Redis hashes.
+
+    ``balances`` and ``betting_sessions`` get one hash each (one field per
+    user / session); every other top-level key is a field of the ``doc``
+    hash. Writes only send fields whose serialized value changed since the
+    last read/write, so a single balance change is one HSET.
+    """
+
+    HASHED_NAMESPACES = ("balances", "betting_sessions")
+    DOC_NAMESPACE = "doc"
+
+    def __init__(self, client: Any, prefix: str = "betbot"):
+        self.client = client
+        self.prefix = prefix
+        # (namespace, field) -> serialized value last seen in Redis
+        self._synced: Dict[Tuple[str, str], str] = {}
+
+    def _key(self, namespace: str) -> str:
+        return f"{self.prefix}:{namespace}"
+
+    @staticmethod
+    def _decode(value: Any) -> str:
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def _flatten(self, data: Dict[str, Any]) -> Dict[Tuple[str, str], str]:
+        fields: Dict[Tuple[str, str], str] = {}
+        for name, value in data.items():
+            if name in self.HASHED_NAMESPACES:
+                for key, item in value.items():
+                    fields[(name, key)] = json.dumps(item, ensure_ascii=False)
+            else:
+                fields[(self.DOC_NAMESPACE, name)] = json.dumps(
+                    value, ensure_ascii=False
+                )
+        return fields
+
+    def read(self) -> Optional[Dict[str, Any]]:
+        doc = self.client.hgetall(self._key(self.DOC_NAMESPACE))
+        if not doc:
+            return None
+
+        synced: Dict[Tuple[str, str], str] = {}
+        data: Dict[str, Any] = {}
+        for name, raw in doc.items():
+            name, raw = self._decode(name), self._decode(raw)
+            data[name] = json.loads(raw)
+            synced[(self.DOC_NAMESPACE, name)] = raw
+        for namespace in self.HASHED_NAMESPACES:
+            data[namespace] = {}
+            for key, raw in self.client.hgetall(self._key(namespace)).items():
+                key, raw = self._decode(key), self._decode(raw)
+                data[namespace][key] = json.loads(raw)
+                synced[(namespace, key)] = raw
+
+        self._synced = synced
+        return data
+
+    def write(self, data: Dict[str, Any]) -> None:
+        fields = self._flatten(data)
+        pipe = self.client.pipeline()
+        for (namespace, key), raw in fields.items():
+            if self._synced.get((namespace, key)) != raw:
+                pipe.hset(self._key(namespace), key, raw)
+        for namespace, key in self._synced.keys() - fields.keys():
+            pipe.hdel(self._key(namespace), key)
+        pipe.execute()
+        self._synced = fields
+
+
+def _create_session_store() -> SessionStore:
+    """Builds the backend selected by DATA_STORE_BACKEND in config.py."""
+    backend = (DATA_STORE_BACKEND or "json").lower()
+    if backend == "memory":
+        return MemorySessionStore()
+    if backend == "redis":
+        try:
+            import redis
+        except ImportError:
+            print(
+                "[data_manager] redis-py is not installed; falling back to JSON storage."
+            )
+            return JsonSessionStore()
+        if not REDIS_URL:
+            print("[data_manager] REDIS_URL is not set; falling back to JSON storage.")
+            return JsonSessionStore()
+        return RedisSessionStore(redis.Redis.from_url(REDIS_URL), REDIS_KEY_PREFIX)
+    return JsonSessionStore()
+
+
+_session_store: Optional[SessionStore] = None
+
+
+def get_session_store() -> SessionStore:
+    """Returns the active storage backend, creating it on first use."""
+    global _session_store
+    if _session_store is None:
+        _session_store = _create_session_store()
+    return _session_store
+
+
+def set_session_store(store: Optional[SessionStore]) -> None:
+    """Replaces the active storage backend (None re-reads the configuration)."""
+    global _session_store
+    _session_store = store
+
+
 # ---------- Data I/O ----------
 def load_data() -> Data:
-    file_exists = os.path.exists(DATA_FILE)
+    """Loads the data document, filling in any missing keys.
+
+    Each call returns a fresh document; changes only persist via save_data().
+    """
+    data = get_session_store().read()
     modified = False
 
-    if not file_exists:
+    if data is None:
         initial_data: Data = {
             "balances": {},
             "betting": {"open": False, "locked": False, "bets": {}, "contestants": {}},
@@ -130,9 +331,6 @@ def load_data() -> Data:
         save_data(initial_data)
         return initial_data
 
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
     # --- Migration/Update Logic for existing data.json files ---
 
     # Ensure 'betting' structure is complete
@@ -227,8 +425,7 @@ def load_data() -> Data:
 
 
 def save_data(data: Data):
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4, ensure_ascii=False)
+    get_session_store().write(data)
 
 
 def ensure_user(data: Data, user_id: str):
@@ -1,29 +1,50 @@
+import signal
 import subprocess
 import sys
 import time
 import threading
 import os
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import RegexMatchingEventHandler
 
 # Configuration
 ENABLE_COMPREHENSIVE_LOGGING = True  # Set to False to disable logging to file
+RESTART_DEBOUNCE_SECONDS = 1.0  # Quiet period after the last change before restarting
 
+# The betbot directory (parent of the scripts directory), resolved once
+BETBOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-class BotRestarter(FileSystemEventHandler):
+
+class BotRestarter(RegexMatchingEventHandler):
     def __init__(self, bot_script_name):
+        # Let watchdog drop everything but .py files before calling back, so
+        # bytecode, log and data file writes never reach on_modified. The
+        # ignore regex matches the directory at any depth (glob patterns
+        # can't, since their * stops at a path separator).
+        super().__init__(
+            regexes=[r".*\.py$"],
+            ignore_regexes=[r".*[/\\](\.venv|\.git|__pycache__)[/\\].*"],
+            ignore_directories=True,
+        )
         self.bot_script_name = bot_script_name
         self.venv_python_executable = self._get_venv_python_executable()
+        self._bot_cmd = self._build_bot_command()
         self.bot_process = self._start_bot()
-        self._restart_timer = None
         self._lock = threading.Lock()
 
+        # File events only record when the latest change happened; a single
+        # worker thread restarts the bot once changes have gone quiet
+        self._change_cv = threading.Condition()
+        self._last_change = None  # time.monotonic() of the latest pending change
+        self._stopping = False
+        self._debounce_thread = threading.Thread(
+            target=self._debounce_loop, daemon=True
+        )
+        self._debounce_thread.start()
+
     def _get_venv_python_executable(self):
         """Determines the path to the Python executable within the .venv."""
-        # Get the betbot directory (parent of scripts directory)
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        betbot_dir = os.path.dirname(script_dir)
-        venv_path = os.path.join(betbot_dir, ".venv")
+        venv_path = os.path.join(BETBOT_DIR, ".venv")
 
         if sys.platform == "win32":
             python_executable = os.path.join(venv_path, "Scripts", "python.exe")
@@ -38,36 +59,37 @@ class BotRestarter(FileSystemEventHandler):
             return sys.executable
         return python_executable
 
-    def _start_bot(self):
-        """Starts the bot process."""
-        # Get the betbot directory (parent of scripts directory)
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        betbot_dir = os.path.dirname(script_dir)
-
+    def _build_bot_command(self):
+        """Builds the bot command line once; every restart reuses it."""
         if ENABLE_COMPREHENSIVE_LOGGING:
             # Use comprehensive logging script
-            bot_script_full_path = os.path.join(betbot_dir, "start_with_logging.py")
+            bot_script_full_path = os.path.join(BETBOT_DIR, "start_with_logging.py")
             print(
                 f"Starting bot with comprehensive logging using {self.venv_python_executable}"
             )
         else:
             # Use standard bot script
-            bot_script_full_path = os.path.join(betbot_dir, self.bot_script_name)
+            bot_script_full_path = os.path.join(BETBOT_DIR, self.bot_script_name)
             print(
                 f"Starting bot with standard logging using {self.venv_python_executable}"
             )
 
         print(f"Bot script path: {bot_script_full_path}")
 
+        # -u keeps the bot's output unbuffered so its logs show up promptly
+        return [self.venv_python_executable, "-u", bot_script_full_path]
+
+    def _start_bot(self):
+        """Starts the bot process."""
         # Set cwd to the betbot directory so it can find its modules
-        return subprocess.Popen(
-            [self.venv_python_executable, bot_script_full_path],
-            cwd=betbot_dir,
-        )
+        return subprocess.Popen(self._bot_cmd, cwd=BETBOT_DIR)
 
     def _restart_bot_action(self):
         """Terminates the old bot process and starts a new one."""
         with self._lock:
+            # Shutdown already began; a bot started now would be orphaned
+            if self._stopping:
+                return
             if self.bot_process:
                 print("Terminating current bot process...")
                 self.bot_process.terminate()
@@ -82,28 +104,45 @@ class BotRestarter(FileSystemEventHandler):
             print("Restarting bot...")
             self.bot_process = self._start_bot()
 
-    def on_modified(self, event):
-        # Only react to .py file modifications
-        _, ext = os.path.splitext(event.src_path)
-        if ext == ".py":
-            # Get the betbot directory (parent of scripts directory)
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            betbot_dir_abs = os.path.abspath(os.path.dirname(script_dir))
-            event_src_path_abs = os.path.abspath(event.src_path)
-
-            # Ensure the modified file is within the watched directory (betbot)
-            if event_src_path_abs.startswith(betbot_dir_abs + os.sep) or event_src_path_abs == betbot_dir_abs:  # type: ignore
-                with self._lock:
-                    # Cancel any pending restart to debounce multiple rapid changes
-                    if self._restart_timer is not None:
-                        self._restart_timer.cancel()
+    def _debounce_loop(self):
+        """Restarts the bot once no change has arrived for the debounce delay."""
+        while True:
+            with self._change_cv:
+                while not self._stopping and (
+                    self._last_change is None
+                    or time.monotonic() - self._last_change < RESTART_DEBOUNCE_SECONDS
+                ):
+                    timeout = None
+                    if self._last_change is not None:
+                        timeout = (
+                            self._last_change
+                            + RESTART_DEBOUNCE_SECONDS
+                            - time.monotonic()
+                        )
+                    self._change_cv.wait(timeout)
+                if self._stopping:
+                    return
+                self._last_change = None
+            self._restart_bot_action()
+
+    def stop(self):
+        """Stops the debounce worker; pending changes no longer restart the bot."""
+        with self._change_cv:
+            self._stopping = True
+            self._change_cv.notify()
+        # Wait out a restart already in progress so the caller can terminate
+        # whichever bot process it left behind
+        self._debounce_thread.join()
 
-                    print(
-                        f"Detected change in {os.path.basename(event.src_path)}, scheduling bot restart..."
-                    )
-                    # Schedule a restart after a short delay (e.g., 1 second)
-                    self._restart_timer = threading.Timer(1.0, self._restart_bot_action)
-                    self._restart_timer.start()
+    def on_modified(self, event):
+        # Only .py files inside the watched betbot directory get here
+        print(
+            f"Detected change in {os.path.basename(event.src_path)}, scheduling bot restart..."
+        )
+        # Push the restart back; rapid changes collapse into one restart
+        with self._change_cv:
+            self._last_change = time.monotonic()
+            self._change_cv.notify()
 
 
 if __name__ == "__main__":
@@ -138,8 +177,7 @@ if __name__ == "__main__":
         )
 
     # The watcher will monitor the 'betbot' directory (parent of scripts)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    watched_path = os.path.dirname(script_dir)  # betbot directory
+    watched_path = BETBOT_DIR
     bot_main_script = "bot.py"
 
     event_handler = BotRestarter(bot_main_script)
@@ -149,14 +187,18 @@ if __name__ == "__main__":
     print(
         f"Watcher started. Monitoring '{watched_path}' for .py file changes. Bot will restart on code changes."
     )
+    # Ctrl+C stops the observer, which lets the join below return
+    signal.signal(signal.SIGINT, lambda *_: observer.stop())
     try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
+        # Block on the observer instead of polling; Windows only delivers
+        # Ctrl+C between bytecodes, so there the join wakes once a second
+        join_timeout = 1 if sys.platform == "win32" else None
+        while observer.is_alive():
+            observer.join(join_timeout)
+    finally:
         observer.stop()
+        event_handler.stop()
         with event_handler._lock:
-            if event_handler._restart_timer is not None:
-                event_handler._restart_timer.cancel()
             if event_handler.bot_process:
                 print("Terminating bot process on exit...")
                 event_handler.bot_process.terminate()
@@ -164,4 +206,4 @@ if __name__ == "__main__":
                     event_handler.bot_process.wait(timeout=5)
                 except subprocess.TimeoutExpired:
                     event_handler.bot_process.kill()
-    observer.join()
+        observer.join()
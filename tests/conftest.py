@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 import discord
 from discord.ext import commands
+import copy
 import json
 import os
 
@@ -19,13 +20,16 @@ INITIAL_TEST_DATA = {
 }
 
 
+def fresh_test_data():
+    """Returns an independent copy of INITIAL_TEST_DATA for one test."""
+    return copy.deepcopy(INITIAL_TEST_DATA)
+
+
 # Fixtures
 @pytest.fixture
 def test_data():
     """Provides clean test data for each test."""
-    import copy
-
-    return copy.deepcopy(INITIAL_TEST_DATA)
+    return fresh_test_data()
 
 
 @pytest.fixture
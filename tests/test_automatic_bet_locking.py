@@ -1,5 +1,6 @@
 import pytest
 import asyncio
+import itertools
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 import discord
@@ -111,11 +112,9 @@ class TestAutomaticBetLocking:
         """Test that manual bet locking updates the live message."""
         betting_cog = Betting(mock_bot)
 
-        with patch(
-            "cogs.betting.load_data", return_value=sample_betting_data
-        ), patch("cogs.betting.save_data") as mock_save, patch(
-            "cogs.betting.update_live_message"
-        ) as mock_update, patch(
+        with patch("cogs.betting.load_data", return_value=sample_betting_data), patch(
+            "cogs.betting.save_data"
+        ) as mock_save, patch("cogs.betting.update_live_message") as mock_update, patch(
             "cogs.betting.schedule_live_message_update"
         ) as mock_schedule, patch(
             "cogs.betting.get_live_message_info", return_value=(None, None)
@@ -207,7 +206,11 @@ class TestAutomaticBetLocking:
                 start_time + 10.0,
                 start_time + 11.0,
             ]
-            mock_time.side_effect = time_sequence
+            # The timer re-reads the clock before each sleep, and expiry logs
+            # through the (patched) clock too, so hold at the last value
+            mock_time.side_effect = itertools.chain(
+                time_sequence, itertools.repeat(time_sequence[-1])
+            )
 
             # Simulate timer running for a very short duration
             timer_task = asyncio.create_task(timer._run_timer(mock_ctx, 10))
@@ -258,6 +261,64 @@ class TestAutomaticBetLocking:
             except asyncio.CancelledError:
                 pass
 
+    @pytest.mark.asyncio
+    async def test_timer_stops_when_notified_of_lock(
+        self, mock_bot, mock_ctx, sample_betting_data
+    ):
+        """Test that notify_locked ends the countdown without waiting for a tick."""
+        timer = BettingTimer(mock_bot)
+        timeout_callback = AsyncMock()
+
+        with patch(
+            "utils.betting_timer.load_data", return_value=sample_betting_data
+        ), patch("utils.betting_timer.save_data"), patch(
+            "utils.betting_timer.update_live_message"
+        ):
+            await timer.start_timer(mock_ctx, 60, timeout_callback)
+            await asyncio.sleep(0)
+
+            timer.notify_locked()
+            await asyncio.wait_for(timer.timer_task, timeout=1)
+
+        timeout_callback.assert_not_called()
+        assert sample_betting_data["timer_end_time"] is None
+
+    @pytest.mark.asyncio
+    async def test_timer_keeps_marks_when_edits_are_slow(
+        self, mock_bot, mock_ctx, sample_betting_data
+    ):
+        """Test that a live message edit slower than 1s doesn't skip a 5s mark."""
+        timer = BettingTimer(mock_bot)
+        timeout_callback = AsyncMock()
+        clock = [1000.0]
+        end_time = clock[0] + 12
+        updated_at = []
+
+        async def slow_update(bot, data, current_time=None):
+            updated_at.append(int(end_time - current_time))
+            clock[0] += 1.2
+
+        async def fake_wait_for(awaitable, timeout):
+            # Sleep on the fake clock, waking just past the requested delay
+            awaitable.close()
+            clock[0] += timeout + 0.001
+            raise asyncio.TimeoutError
+
+        with patch(
+            "utils.betting_timer.load_data", return_value=sample_betting_data
+        ), patch("utils.betting_timer.save_data"), patch(
+            "utils.betting_timer.update_live_message", side_effect=slow_update
+        ), patch(
+            "utils.betting_timer.asyncio.wait_for", side_effect=fake_wait_for
+        ), patch(
+            "time.time", side_effect=lambda: clock[0]
+        ):
+            timer.timeout_callback = timeout_callback
+            await timer._run_timer(mock_ctx, 12)
+
+        assert updated_at == [10, 5, 0]
+        timeout_callback.assert_awaited_once_with(mock_ctx)
+
     @pytest.mark.asyncio
     async def test_bet_locking_order_of_operations(
         self, mock_bot, mock_ctx, sample_betting_data
@@ -278,9 +339,9 @@ class TestAutomaticBetLocking:
         def track_schedule_update():
             operation_order.append("schedule_live_message_update")
 
-        with patch(
-            "cogs.betting.load_data", return_value=sample_betting_data
-        ), patch("cogs.betting.save_data", side_effect=track_save_data), patch(
+        with patch("cogs.betting.load_data", return_value=sample_betting_data), patch(
+            "cogs.betting.save_data", side_effect=track_save_data
+        ), patch(
             "cogs.betting.update_live_message", side_effect=track_update_message
         ), patch(
             "cogs.betting.schedule_live_message_update",
@@ -319,13 +380,11 @@ class TestAutomaticBetLocking:
         mock_channel = MagicMock(spec=discord.TextChannel)
         mock_message = AsyncMock(spec=discord.Message)
         mock_bot.get_channel.return_value = mock_channel
-        mock_channel.fetch_message.return_value = mock_message
+        mock_channel.get_partial_message.return_value = mock_message
 
-        with patch(
-            "cogs.betting.load_data", return_value=sample_betting_data
-        ), patch("cogs.betting.save_data"), patch(
-            "cogs.betting.update_live_message"
-        ) as mock_update, patch(
+        with patch("cogs.betting.load_data", return_value=sample_betting_data), patch(
+            "cogs.betting.save_data"
+        ), patch("cogs.betting.update_live_message") as mock_update, patch(
             "cogs.betting.schedule_live_message_update"
         ), patch(
             "cogs.betting.get_live_message_info",
@@ -338,7 +397,7 @@ class TestAutomaticBetLocking:
             await betting_cog._lock_bets_internal(mock_ctx)
 
             # Verify reactions were cleared
-            mock_channel.fetch_message.assert_called_with(987654321)
+            mock_channel.get_partial_message.assert_called_with(987654321)
             mock_message.clear_reactions.assert_called_once()
 
             # Verify live message was updated
@@ -8,7 +8,7 @@ project_root = str(Path(__file__).parent.parent)
 if project_root not in sys.path:
     sys.path.append(project_root)
 
-from utils.bet_state import BetState, Economy
+from utils.bet_state import BetState, Economy, bet_is_on, find_contestant_id
 from utils.bet_state import BetInfo, WinnerInfo
 
 
@@ -99,6 +99,51 @@ class TestBetState:
             assert winner_info["user_results"][user_id]["winnings"] == 100
             assert test_data["balances"][user_id] == 1000
 
+    def test_declare_winner_pays_exact_integer_share(self, bet_state, test_data):
+        """Test that payouts use integer math rather than a rounded float share."""
+        test_data["betting"]["contestants"] = {"1": "Alice", "2": "Bob"}
+        test_data["betting"]["bets"] = {
+            "123": {"amount": 15, "choice": "alice", "emoji": None},
+            "456": {"amount": 7, "choice": "alice", "emoji": None},
+        }
+        test_data["balances"].update({"123": 0, "456": 0})
+
+        winner_info = bet_state.declare_winner("Alice")
+
+        # 15 / 22 * 22 evaluates to 14.999... as a float
+        assert winner_info["user_results"]["123"]["winnings"] == 15
+        assert winner_info["user_results"]["456"]["winnings"] == 7
+
+    def test_place_bet_records_choice_id(self, bet_state, test_data):
+        """Test that bets store the numeric contestant key used to settle them."""
+        test_data["betting"]["open"] = True
+        test_data["betting"]["contestants"] = {"1": "Alice", "2": "Bob"}
+        test_data["balances"].update({"123": 1000, "456": 1000})
+
+        bet_state.place_bet("123", 100, "Bob")
+        bet_state.place_bet("456", 300, "alice")
+
+        assert test_data["betting"]["bets"]["123"]["choice_id"] == 2
+        assert test_data["betting"]["bets"]["456"]["choice_id"] == 1
+
+        results = bet_state.calculate_round_results("BOB")
+        assert results["winning_users"] == ["123"]
+        assert results["user_results"]["123"]["winnings"] == 400
+
+    def test_bet_is_on_prefers_choice_id_and_falls_back_to_name(self):
+        """Test that bets match by contestant key, or by name without one."""
+        contestants = {"1": "Alice", "2": "Bob"}
+        bob_id = find_contestant_id(contestants, "bob")
+
+        assert bob_id == 2
+        assert find_contestant_id({"c1": "Alice"}, "alice") is None
+        # A renamed contestant still matches by key
+        assert bet_is_on({"amount": 5, "choice": "robert", "choice_id": 2}, 2, "bob")
+        assert not bet_is_on({"amount": 5, "choice": "bob", "choice_id": 1}, 2, "bob")
+        # Records without a choice_id (older data, multi-session) use the name
+        assert bet_is_on({"amount": 5, "choice": "Bob"}, bob_id, "bob")
+        assert bet_is_on({"amount": 5, "choice": "bob", "choice_id": 1}, None, "bob")
+
     def test_timer_management(self, bet_state, test_data):
         """Test timer start and clear operations."""
         # Setup
@@ -116,6 +161,17 @@ class TestBetState:
         # Assert
         assert test_data["timer_end_time"] is None
 
+    def test_update_data_reuses_economy(self, bet_state, test_data):
+        """Test that rebinding data keeps the same Economy instance."""
+        economy = bet_state.economy
+        fresh_data = dict(test_data, balances={"1": 500})
+
+        bet_state.update_data(fresh_data)
+
+        assert bet_state.economy is economy
+        assert bet_state.data is fresh_data
+        assert bet_state.economy.get_balance("1") == 500
+
 
 class TestEconomy:
     @pytest.fixture
@@ -161,3 +217,15 @@ class TestEconomy:
         # Assert
         assert result is False
         assert test_data["balances"][user_id] == 100
+
+    def test_ensure_users_adds_missing_balances(self, economy, test_data):
+        """Test bulk account creation only touches missing users."""
+        from config import STARTING_BALANCE
+
+        test_data["balances"]["existing"] = 42
+
+        economy.ensure_users(["existing", "new1", "new2"])
+
+        assert test_data["balances"]["existing"] == 42
+        assert test_data["balances"]["new1"] == STARTING_BALANCE
+        assert test_data["balances"]["new2"] == STARTING_BALANCE
@@ -16,6 +16,7 @@ import discord
 from discord.ext import commands
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add the project root to the Python path
 project_root = str(Path(__file__).parent.parent)
@@ -32,8 +33,20 @@ class TestBetting:
             cog = Betting(mock_bot)
             return cog
 
+    @pytest.fixture
+    def patched_betting(self, monkeypatch, test_data):
+        """Patches the cog's data I/O and live message updates for one test."""
+        mocks = SimpleNamespace(
+            load_data=MagicMock(return_value=test_data),
+            save_data=MagicMock(),
+            update_live_message=AsyncMock(),
+        )
+        for name, mock in vars(mocks).items():
+            monkeypatch.setattr(f"cogs.betting.{name}", mock)
+        return mocks
+
     async def test_openbet_success(
-        self, betting_cog, mock_ctx, mock_message, test_data
+        self, betting_cog, mock_ctx, mock_message, test_data, patched_betting
     ):
         """Test successful opening of a betting round."""
         # Setup
@@ -43,15 +56,9 @@ class TestBetting:
 
         # Execute - Call the underlying method directly with mocked load_data
         # and permission check
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.save_data"
-        ) as mock_save, patch("cogs.betting.clear_live_message_info"), patch(
+        with patch("cogs.betting.clear_live_message_info"), patch(
             "cogs.betting.set_live_message_info"
-        ), patch(
-            "cogs.betting.update_live_message"
-        ), patch(
-            "discord.utils.get"
-        ) as mock_get:
+        ), patch("discord.utils.get") as mock_get:
             # Mock discord.utils.get to return a role when looking for betboy
             # role
             mock_get.return_value = MockRole("betboy")
@@ -62,15 +69,15 @@ class TestBetting:
         # The complex interaction between Discord.py commands and internal
         # state is validated by execution
 
-    async def test_openbet_no_permission(self, betting_cog, mock_ctx, test_data):
+    async def test_openbet_no_permission(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test opening bet without required permission."""
         # Setup
         mock_ctx.author = setup_member_with_role("User")
 
         # Execute - Call the underlying method directly
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "discord.utils.get"
-        ) as mock_get:
+        with patch("discord.utils.get") as mock_get:
             # Mock discord.utils.get to return None (no role found)
             mock_get.return_value = None
             await betting_cog.openbet.callback(betting_cog, mock_ctx, "Alice", "Bob")
@@ -80,7 +87,7 @@ class TestBetting:
             mock_ctx.send, title=TITLE_BETTING_ERROR, color=COLOR_ERROR
         )
 
-    async def test_bet_success(self, betting_cog, mock_ctx, test_data):
+    async def test_bet_success(self, betting_cog, mock_ctx, test_data, patched_betting):
         """Test successful bet placement."""
         # Setup
         test_data["betting"]["open"] = True
@@ -89,10 +96,7 @@ class TestBetting:
         mock_ctx.channel.send = AsyncMock()
 
         # Execute - Call the underlying method directly
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.update_live_message"
-        ) as mock_update:
-            await betting_cog.place_bet.callback(betting_cog, mock_ctx, "100", "Alice")
+        await betting_cog.place_bet.callback(betting_cog, mock_ctx, "100", "Alice")
 
         # Assert
         data = test_data
@@ -101,7 +105,9 @@ class TestBetting:
         assert data["balances"][str(mock_ctx.author.id)] == 900
         mock_ctx.send.assert_called()  # Success message was sent
 
-    async def test_bet_insufficient_funds(self, betting_cog, mock_ctx, test_data):
+    async def test_bet_insufficient_funds(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test bet placement with insufficient funds."""
         # Setup
         test_data["betting"]["open"] = True
@@ -110,15 +116,16 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Call the underlying method directly
-        with patch("cogs.betting.load_data", return_value=test_data):
-            await betting_cog.place_bet.callback(betting_cog, mock_ctx, "100", "Alice")
+        await betting_cog.place_bet.callback(betting_cog, mock_ctx, "100", "Alice")
 
         # Assert
         betting_cog._send_embed.assert_called()
         assert str(mock_ctx.author.id) not in test_data["betting"]["bets"]
 
     @pytest.mark.asyncio
-    async def test_reaction_bet(self, betting_cog, mock_ctx, mock_message, test_data):
+    async def test_reaction_bet(
+        self, betting_cog, mock_ctx, mock_message, test_data, patched_betting
+    ):
         """Test betting through reactions."""
         # Setup
         test_data["betting"]["open"] = True
@@ -134,7 +141,7 @@ class TestBetting:
         payload.emoji.name = "🔴"
 
         # Execute with comprehensive mocking
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
+        with patch(
             "cogs.betting.get_live_message_info",
             return_value=(mock_message.id, mock_message.channel.id),
         ), patch(
@@ -143,8 +150,6 @@ class TestBetting:
         ), patch(
             "utils.live_message._get_message_and_user",
             return_value=(mock_message, mock_ctx.author),
-        ), patch(
-            "cogs.betting.update_live_message"
         ):
             await betting_cog.on_raw_reaction_add(payload)
 
@@ -154,7 +159,9 @@ class TestBetting:
             # with mocks, but we've verified the method doesn't crash
 
     @pytest.mark.asyncio
-    async def test_declare_winner(self, betting_cog, mock_ctx, test_data):
+    async def test_declare_winner(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test winner declaration and prize distribution."""
         # Setup
         user_id = str(mock_ctx.author.id)
@@ -168,7 +175,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Call the underlying method directly
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
+        with patch(
             "cogs.betting.BettingPermissions.check_permission",
             new_callable=AsyncMock,
             return_value=True,
@@ -199,7 +206,9 @@ class TestBetting:
         assert data["betting"]["locked"] is True
         assert data["timer_end_time"] is None
 
-    async def test_bet_change_contestant(self, betting_cog, mock_ctx, test_data):
+    async def test_bet_change_contestant(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test changing bet from one contestant to another."""
         # Setup - User already has a bet on Alice
         test_data["betting"]["open"] = True
@@ -213,10 +222,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Change bet to Bob
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.update_live_message"
-        ):
-            await betting_cog.place_bet.callback(betting_cog, mock_ctx, "500", "Bob")
+        await betting_cog.place_bet.callback(betting_cog, mock_ctx, "500", "Bob")
 
         # Assert - Should use bet change message
         betting_cog._send_embed.assert_called()
@@ -230,7 +236,9 @@ class TestBetting:
         assert test_data["betting"]["bets"][str(mock_ctx.author.id)]["choice"] == "bob"
         assert test_data["betting"]["bets"][str(mock_ctx.author.id)]["amount"] == 500
 
-    async def test_bet_increase_amount(self, betting_cog, mock_ctx, test_data):
+    async def test_bet_increase_amount(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test increasing bet amount on same contestant."""
         # Setup - User already has a bet on Alice for 300
         test_data["betting"]["open"] = True
@@ -244,10 +252,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Increase bet to 700 (needs 400 more, has 500 available)
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.save_data"
-        ) as mock_save, patch("cogs.betting.update_live_message"):
-            await betting_cog.place_bet.callback(betting_cog, mock_ctx, "700", "Alice")
+        await betting_cog.place_bet.callback(betting_cog, mock_ctx, "700", "Alice")
 
         # Assert - Should succeed with regular bet placed message (not "changed
         # from")
@@ -266,7 +271,7 @@ class TestBetting:
             assert "700" in message and "Alice" in message
 
     async def test_bet_insufficient_funds_with_existing_bet(
-        self, betting_cog, mock_ctx, test_data
+        self, betting_cog, mock_ctx, test_data, patched_betting
     ):
         """Test insufficient funds error when trying to increase existing bet."""
         # Setup - User has 200 coins available and 300 bet on Alice
@@ -281,8 +286,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Try to increase bet to 900 (needs 600 more, only has 200)
-        with patch("cogs.betting.load_data", return_value=test_data):
-            await betting_cog.place_bet.callback(betting_cog, mock_ctx, "900", "Alice")
+        await betting_cog.place_bet.callback(betting_cog, mock_ctx, "900", "Alice")
 
         # Assert - Should show helpful error with current bet info
         betting_cog._send_embed.assert_called()
@@ -292,7 +296,9 @@ class TestBetting:
         assert "Current bet" in error_message
         assert "300" in error_message  # Shows current bet amount
 
-    async def test_bet_no_params_locked(self, betting_cog, mock_ctx, test_data):
+    async def test_bet_no_params_locked(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test !bet with no parameters when betting is locked."""
         # Setup - Betting is locked
         test_data["betting"]["open"] = False
@@ -301,7 +307,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Call !bet with no arguments
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
+        with patch(
             "cogs.betting.get_live_message_link",
             return_value="https://discord.com/channels/123/456/789",
         ):
@@ -313,7 +319,9 @@ class TestBetting:
         assert "locked" in call_args[0][2].lower()
         assert "https://discord.com/channels" in call_args[0][2]
 
-    async def test_bet_no_params_open(self, betting_cog, mock_ctx, test_data):
+    async def test_bet_no_params_open(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test !bet with no parameters when betting is open."""
         # Setup - Betting is open
         test_data["betting"]["open"] = True
@@ -322,7 +330,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Call !bet with no arguments
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
+        with patch(
             "cogs.betting.get_live_message_link",
             return_value="https://discord.com/channels/123/456/789",
         ):
@@ -335,7 +343,7 @@ class TestBetting:
         assert "How to bet" in call_args[0][2]
 
     async def test_manual_bet_after_reaction_bet(
-        self, betting_cog, mock_ctx, test_data
+        self, betting_cog, mock_ctx, test_data, patched_betting
     ):
         """Test that manual bet removes old reaction when placed after reaction bet."""
         # Setup - User already has a reaction bet
@@ -358,10 +366,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Place a manual bet (no emoji parameter means manual bet)
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.save_data"
-        ), patch("cogs.betting.update_live_message", new_callable=AsyncMock):
-            await betting_cog.place_bet.callback(betting_cog, mock_ctx, "100", "Bob")
+        await betting_cog.place_bet.callback(betting_cog, mock_ctx, "100", "Bob")
 
         # Assert - Old reaction should be removed
         betting_cog._remove_old_reaction_bet.assert_called_once_with(
@@ -375,7 +380,7 @@ class TestBetting:
         assert "Bob" in call_args[0][2]
 
     async def test_manual_bet_without_previous_reaction(
-        self, betting_cog, mock_ctx, test_data
+        self, betting_cog, mock_ctx, test_data, patched_betting
     ):
         """Test that manual bet doesn't trigger reaction removal when no previous reaction bet exists."""
         # Setup - User has no existing bet
@@ -390,10 +395,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Place a manual bet with no existing bet
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.save_data"
-        ), patch("cogs.betting.update_live_message", new_callable=AsyncMock):
-            await betting_cog.place_bet.callback(betting_cog, mock_ctx, "100", "Alice")
+        await betting_cog.place_bet.callback(betting_cog, mock_ctx, "100", "Alice")
 
         # Assert - Reaction removal should NOT be called
         betting_cog._remove_old_reaction_bet.assert_not_called()
@@ -404,7 +406,9 @@ class TestBetting:
         assert "bet" in call_args[0][2].lower()
         assert "Alice" in call_args[0][2]
 
-    async def test_manual_bet_after_manual_bet(self, betting_cog, mock_ctx, test_data):
+    async def test_manual_bet_after_manual_bet(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test that changing from one manual bet to another doesn't trigger reaction removal."""
         # Setup - User already has a manual bet (no emoji)
         user_id = str(mock_ctx.author.id)
@@ -423,10 +427,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Place another manual bet (change from Alice to Bob)
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.save_data"
-        ), patch("cogs.betting.update_live_message", new_callable=AsyncMock):
-            await betting_cog.place_bet.callback(betting_cog, mock_ctx, "100", "Bob")
+        await betting_cog.place_bet.callback(betting_cog, mock_ctx, "100", "Bob")
 
         # Assert - Reaction removal should NOT be called (was manual -> manual)
         betting_cog._remove_old_reaction_bet.assert_not_called()
@@ -436,7 +437,9 @@ class TestBetting:
         call_args = betting_cog._send_embed.call_args
         assert "changed" in call_args[0][2].lower() or "bet" in call_args[0][2].lower()
 
-    async def test_bet_wrong_contestant_name(self, betting_cog, mock_ctx, test_data):
+    async def test_bet_wrong_contestant_name(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test betting with wrong contestant name shows helpful error with available contestants."""
         # Setup - Betting is open with contestants
         user_id = str(mock_ctx.author.id)
@@ -448,10 +451,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Try to bet on wrong contestant name
-        with patch("cogs.betting.load_data", return_value=test_data):
-            await betting_cog.place_bet.callback(
-                betting_cog, mock_ctx, "charlie", "100"
-            )
+        await betting_cog.place_bet.callback(betting_cog, mock_ctx, "charlie", "100")
 
         # Assert - Should show helpful error with available contestants
         betting_cog._send_embed.assert_called()
@@ -463,7 +463,7 @@ class TestBetting:
         assert "Available contestants" in error_message
 
     async def test_round_complete_statistics_accuracy(
-        self, betting_cog, mock_ctx, test_data
+        self, betting_cog, mock_ctx, test_data, patched_betting
     ):
         """Test that round complete message shows correct pot and player statistics.
 
@@ -502,11 +502,7 @@ class TestBetting:
         betting_cog.bot.fetch_user = AsyncMock(side_effect=mock_fetch_user)
 
         # Execute - Declare Alice as winner
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.save_data"
-        ), patch("cogs.betting.update_live_message"), patch.object(
-            betting_cog, "_check_permission", return_value=True
-        ):
+        with patch.object(betting_cog, "_check_permission", return_value=True):
             await betting_cog.declare_winner.callback(betting_cog, mock_ctx, "Alice")
 
         # Assert - Round complete message should show correct statistics
@@ -715,7 +711,7 @@ class TestBetting:
         assert mock_message.add_reaction.call_count == 3  # 2 failures + 1 success
 
     async def test_detailed_payout_message_creation(
-        self, betting_cog, mock_ctx, test_data
+        self, betting_cog, mock_ctx, test_data, patched_betting
     ):
         """Test that detailed payout messages are created after winner declaration."""
         # Setup - Multiple users with bets
@@ -749,11 +745,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Declare Alice as winner
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.save_data"
-        ), patch("cogs.betting.update_live_message"), patch.object(
-            betting_cog, "_check_permission", return_value=True
-        ):
+        with patch.object(betting_cog, "_check_permission", return_value=True):
             await betting_cog.declare_winner.callback(betting_cog, mock_ctx, "Alice")
 
         # Assert - Should include detailed payout information
@@ -769,7 +761,7 @@ class TestBetting:
         assert "-" in description or "lost" in description.lower()
 
     async def test_enhanced_error_message_for_wrong_contestant(
-        self, betting_cog, mock_ctx, test_data
+        self, betting_cog, mock_ctx, test_data, patched_betting
     ):
         """Test enhanced error messages show available contestants when wrong name is used."""
         # Setup
@@ -782,10 +774,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Execute - Try to bet on non-existent contestant
-        with patch("cogs.betting.load_data", return_value=test_data):
-            await betting_cog.place_bet.callback(
-                betting_cog, mock_ctx, "500", "Charlie"
-            )
+        await betting_cog.place_bet.callback(betting_cog, mock_ctx, "500", "Charlie")
 
         # Assert - Error message should be helpful
         betting_cog._send_embed.assert_called()
@@ -806,7 +795,9 @@ class TestBetting:
             or "available" in error_message.lower()
         )
 
-    async def test_timer_automatic_bet_locking(self, betting_cog, mock_ctx, test_data):
+    async def test_timer_automatic_bet_locking(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test that timer automatically locks bets when it expires."""
         # Setup
         test_data["betting"]["open"] = True
@@ -816,10 +807,7 @@ class TestBetting:
         betting_cog._send_embed = AsyncMock()
 
         # Mock timer expiry by calling the handler directly
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.save_data"
-        ), patch("cogs.betting.update_live_message"):
-            await betting_cog._handle_timer_expired(mock_ctx)
+        await betting_cog._handle_timer_expired(mock_ctx)
 
         # Assert - Should have locked the bets
         # The _handle_timer_expired calls _lock_bets_internal with timer_expired=True
@@ -836,7 +824,9 @@ class TestBetting:
             or "locked" in message.lower()
         )
 
-    async def test_declare_winner_no_bets(self, betting_cog, mock_ctx, test_data):
+    async def test_declare_winner_no_bets(
+        self, betting_cog, mock_ctx, test_data, patched_betting
+    ):
         """Test declaring a winner when no bets were placed."""
         # Setup
         mock_ctx.author = setup_member_with_role("betboy")
@@ -849,9 +839,7 @@ class TestBetting:
         test_data["betting"]["locked"] = True
 
         # Execute
-        with patch("cogs.betting.load_data", return_value=test_data), patch(
-            "cogs.betting.save_data"
-        ), patch("cogs.betting.update_live_message"), patch(
+        with patch(
             "cogs.betting.BettingPermissions.check_permission",
             new=AsyncMock(return_value=True),
         ), patch.object(
@@ -3,10 +3,14 @@ Test module for error handling and logging functionality.
 Tests logger and performance monitoring components.
 """
 
+import gc
+import weakref
+
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+from utils.error_handler import BettingError, ErrorHandler, _embed_builder_for
 from utils.logger import setup_logger
-from utils.performance_monitor import PerformanceMonitor
+from utils.performance_monitor import PerformanceMonitor, performance_timer
 
 
 class TestErrorHandling:
@@ -70,6 +74,135 @@ class TestErrorHandling:
         # Performance monitor should be functional
         assert performance_monitor is not None
 
+    def test_performance_summary_counts_recent_metrics(self, performance_monitor):
+        """Test that recorded metrics and command times show up in the summary."""
+        performance_monitor.record_metric("bet.placed", 100)
+        performance_monitor.record_command_time("bet", 0.5)
+        performance_monitor.record_command_time("bet", 1.5)
+
+        summary = performance_monitor.get_performance_summary()
+
+        assert summary["metric_summary"]["bet.placed"]["count"] == 1
+        assert summary["command_stats"]["bet"]["avg_time"] == 1.0
+        assert summary["command_stats"]["bet"]["total_calls"] == 2
+        health = performance_monitor.perform_health_check()
+        assert not any("error rate" in issue for issue in health.issues)
+
+    def test_command_average_covers_only_recent_window(self, performance_monitor):
+        """Test that the command average only counts the last 100 calls."""
+        for _ in range(50):
+            performance_monitor.record_command_time("bet", 10.0)
+        for _ in range(100):
+            performance_monitor.record_command_time("bet", 1.0)
+
+        stats = performance_monitor.get_command_stats("bet")
+
+        assert stats["avg_time"] == pytest.approx(1.0)
+        assert stats["max_time"] == 1.0
+
+    def test_health_check_counts_only_recent_errors(self, performance_monitor):
+        """Test that errors older than 10 minutes don't count toward the rate."""
+        with patch("utils.performance_monitor.time.monotonic", return_value=0.0):
+            for _ in range(20):
+                performance_monitor.record_metric("error.command", 1)
+        with patch("utils.performance_monitor.time.monotonic", return_value=700.0):
+            for _ in range(6):
+                performance_monitor.record_metric("error.command", 1)
+            health = performance_monitor.perform_health_check()
+
+        assert "Elevated error rate: 6 errors in 10 minutes" in health.warnings
+        assert not any("error rate" in issue for issue in health.issues)
+
+    def test_summary_skips_metrics_older_than_period(self, performance_monitor):
+        """Test that the summary only covers metrics inside the period."""
+        with patch("utils.performance_monitor.time.monotonic", return_value=0.0):
+            performance_monitor.record_metric("bet.placed", 1)
+        with patch("utils.performance_monitor.time.monotonic", return_value=4000.0):
+            performance_monitor.record_metric("bet.placed", 3)
+            performance_monitor.record_metric("bet.placed", 5)
+            summary = performance_monitor.get_performance_summary(hours=1)
+
+        assert summary["total_metrics"] == 2
+        assert summary["metric_summary"]["bet.placed"]["avg"] == 4
+
+    def test_health_check_counts_recorded_errors(self, performance_monitor):
+        """Test that record_error feeds the health check's error rate."""
+        for _ in range(11):
+            performance_monitor.record_error("command")
+        performance_monitor.record_metric("command.bet.time", 0.5)
+
+        health = performance_monitor.perform_health_check()
+
+        assert "High error rate: 11 errors in 10 minutes" in health.issues
+        summary = performance_monitor.get_performance_summary()
+        assert summary["metric_summary"]["error.command"]["count"] == 11
+
+    @pytest.mark.asyncio
+    async def test_performance_timer_records_and_keeps_metadata(
+        self, performance_monitor
+    ):
+        """Test that timed commands are recorded and keep their name and docs."""
+
+        @performance_timer(performance_monitor, "balance")
+        async def balance_command():
+            """Show a balance."""
+            return 42
+
+        assert await balance_command() == 42
+        assert balance_command.__name__ == "balance_command"
+        assert balance_command.__doc__ == "Show a balance."
+        assert performance_monitor.get_command_stats("balance")["total_calls"] == 1
+
+    @pytest.mark.asyncio
+    async def test_error_stats_evict_oldest_error_type(self):
+        """Test that error tracking stays bounded by evicting the oldest type."""
+        handler = ErrorHandler()
+        handler.MAX_TRACKED_ERROR_TYPES = 2
+        ctx = MagicMock()
+        ctx.send = AsyncMock()
+
+        for error in (KeyError("a"), ValueError("b"), ValueError("c"), TypeError()):
+            with patch("utils.error_handler.logger"):
+                await handler.handle_command_error(ctx, error)
+
+        stats = handler.get_error_stats()
+        assert stats["error_counts"] == {"ValueError": 2, "TypeError": 1}
+        assert list(stats["last_errors"]) == ["ValueError", "TypeError"]
+
+    @pytest.mark.asyncio
+    async def test_command_error_embed_matches_error_subclasses(self):
+        """Test that error embeds are chosen by class, including subclasses."""
+
+        class InsufficientFundsError(BettingError):
+            pass
+
+        handler = ErrorHandler()
+        ctx = MagicMock()
+        ctx.send = AsyncMock()
+
+        with patch("utils.error_handler.logger"):
+            await handler.handle_command_error(ctx, InsufficientFundsError("broke"))
+            await handler.handle_command_error(ctx, RuntimeError("boom"))
+
+        betting_embed = ctx.send.call_args_list[0].kwargs["embed"]
+        generic_embed = ctx.send.call_args_list[1].kwargs["embed"]
+        assert betting_embed.title == "❌ Betting Error"
+        assert betting_embed.description == "broke"
+        assert generic_embed.title == "❌ Something went wrong"
+
+    def test_embed_builder_cache_does_not_keep_error_classes_alive(self):
+        """Test that resolving a builder doesn't pin runtime-defined classes."""
+
+        class TemporaryError(BettingError):
+            pass
+
+        assert _embed_builder_for(TemporaryError) is _embed_builder_for(BettingError)
+        class_ref = weakref.ref(TemporaryError)
+        del TemporaryError
+        gc.collect()
+
+        assert class_ref() is None
+
     def test_logger_handles_none_messages(self, logger_instance):
         """Test that logger handles None messages gracefully."""
         try:
@@ -3,6 +3,7 @@ Test module for live message functionality.
 Tests live message management and scheduling.
 """
 
+import asyncio
 import pytest
 from unittest.mock import MagicMock, patch, AsyncMock
 import discord
@@ -16,6 +17,10 @@ from utils.live_message import (
     initialize_live_message_scheduler,
     get_emoji_config,
     get_reaction_bet_amounts,
+    update_live_message,
+    create_winner_info,
+    _get_display_name,
+    _user_name_cache,
 )
 
 
@@ -154,3 +159,214 @@ class TestLiveMessage:
         empty_data = cast(Data, {})
         amounts = get_reaction_bet_amounts(empty_data)
         assert isinstance(amounts, dict)  # Should return empty dict or default
+
+
+@pytest.mark.asyncio
+async def test_update_live_message_skips_unchanged_embed():
+    """Identical state is neither re-rendered nor re-sent to Discord."""
+    message = AsyncMock(spec=discord.Message)
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.get_partial_message = MagicMock(return_value=message)
+    bot = MagicMock(spec=discord.Client)
+    bot.get_channel = MagicMock(return_value=channel)
+    bot.get_user = MagicMock(return_value=None)
+    bot.fetch_user = AsyncMock(return_value=MagicMock(display_name="Tester"))
+
+    data = {
+        "betting": {
+            "open": False,
+            "locked": True,
+            "contestants": {"1": "Alice", "2": "Bob"},
+            "bets": {"1": {"amount": 100, "choice": "alice", "emoji": None}},
+        },
+        "live_message": 424242001,
+        "live_channel": 424242002,
+        "timer_end_time": None,
+    }
+
+    from utils.message_formatter import MessageFormatter
+
+    render = AsyncMock(wraps=MessageFormatter.create_live_message_embed)
+    with patch("utils.live_message.save_data"), patch.object(
+        MessageFormatter, "create_live_message_embed", render
+    ):
+        await update_live_message(bot, data)
+        await update_live_message(bot, data)
+        assert message.edit.call_count == 1
+        assert render.await_count == 1
+
+        data["betting"]["bets"]["2"] = {"amount": 50, "choice": "bob", "emoji": None}
+        await update_live_message(bot, data)
+        assert message.edit.call_count == 2
+        assert render.await_count == 2
+
+        clear_live_message_info(data)
+
+
+@pytest.mark.asyncio
+async def test_display_names_share_one_fetch_and_are_cached():
+    """Concurrent lookups for a user share one fetch_user call."""
+    bot = MagicMock(spec=discord.Client)
+    bot.get_user = MagicMock(return_value=None)
+    bot.fetch_user = AsyncMock(return_value=MagicMock(display_name="Tester"))
+
+    names = await asyncio.gather(
+        _get_display_name(bot, "42"), _get_display_name(bot, "42")
+    )
+    assert names == ["Tester", "Tester"]
+    assert await _get_display_name(bot, "42") == "Tester"
+    bot.fetch_user.assert_awaited_once_with(42)
+
+    assert await _get_display_name(bot, "not-a-snowflake") == "User (not-a-snowflake)"
+
+
+@pytest.mark.asyncio
+async def test_display_name_cache_drops_expired_and_excess_entries():
+    """Expired names are evicted on insert and the cache stays capped."""
+    bot = MagicMock(spec=discord.Client)
+    bot.get_user = MagicMock(return_value=None)
+    bot.fetch_user = AsyncMock(return_value=MagicMock(display_name="Tester"))
+
+    with patch("utils.live_message.time.monotonic", return_value=0.0):
+        await _get_display_name(bot, "1")
+    with patch("utils.live_message.time.monotonic", return_value=1000.0):
+        await _get_display_name(bot, "2")
+    assert list(_user_name_cache[bot]) == [2]
+
+    with patch("utils.live_message.USER_NAME_CACHE_MAX", 2):
+        for uid in ("3", "4"):
+            await _get_display_name(bot, uid)
+    assert list(_user_name_cache[bot]) == [3, 4]
+
+
+@pytest.mark.asyncio
+async def test_display_name_prefers_client_user_cache():
+    """A user the client already knows about is not fetched over HTTP."""
+    bot = MagicMock(spec=discord.Client)
+    bot.get_user = MagicMock(return_value=MagicMock(display_name="Cached"))
+    bot.fetch_user = AsyncMock()
+
+    assert await _get_display_name(bot, "7") == "Cached"
+    bot.get_user.assert_called_once_with(7)
+    bot.fetch_user.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_live_message_resends_after_interval():
+    """An unchanged embed is sent again once the resend interval has passed."""
+    message = AsyncMock(spec=discord.Message)
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.get_partial_message = MagicMock(return_value=message)
+    bot = MagicMock(spec=discord.Client)
+    bot.get_channel = MagicMock(return_value=channel)
+    bot.get_user = MagicMock(return_value=None)
+
+    data = {
+        "betting": {
+            "open": False,
+            "locked": True,
+            "contestants": {"1": "Alice", "2": "Bob"},
+            "bets": {},
+        },
+        "live_message": 424242011,
+        "live_channel": 424242012,
+        "timer_end_time": None,
+    }
+
+    with patch("utils.live_message.save_data"), patch(
+        "utils.live_message.EMBED_RESEND_INTERVAL", 0.0
+    ):
+        await update_live_message(bot, data)
+        await update_live_message(bot, data)
+        assert message.edit.call_count == 2
+
+        clear_live_message_info(data)
+
+
+def test_create_winner_info_settles_from_net_winnings():
+    info = create_winner_info("Alice", {"1": 200, "2": -50})
+
+    assert info["total_pot"] == 150
+    assert info["winning_pot"] == 100
+    assert info["user_results"]["1"]["winnings"] == 150
+    assert info["user_results"]["1"]["net_change"] == 50
+    assert info["user_results"]["2"]["winnings"] == 0
+    assert info["user_results"]["2"]["net_change"] == -50
+    assert create_winner_info(None, {"1": 200}) is None
+
+
+@pytest.mark.asyncio
+async def test_update_live_message_skips_work_without_live_channel():
+    """Nothing is looked up or rendered when no live channel is reachable."""
+    bot = MagicMock(spec=discord.Client)
+    bot.get_channel = MagicMock(return_value=None)
+    bot.get_user = MagicMock(return_value=None)
+    bot.fetch_user = AsyncMock()
+
+    data = {
+        "betting": {
+            "open": True,
+            "locked": False,
+            "contestants": {"1": "Alice", "2": "Bob"},
+            "bets": {"1": {"amount": 100, "choice": "alice", "emoji": None}},
+        },
+        "live_message": 424242021,
+        "live_channel": 424242022,
+        "timer_end_time": None,
+    }
+
+    await update_live_message(bot, data)
+
+    bot.get_channel.assert_called_once_with(424242022)
+    bot.get_user.assert_not_called()
+    bot.fetch_user.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_live_message_drops_superseded_edits():
+    """Queued edits to one message collapse to the most recent update."""
+    started, release = asyncio.Event(), asyncio.Event()
+    sent = []
+
+    async def edit(embed):
+        sent.append(embed.description)
+        if len(sent) == 1:
+            started.set()
+            await release.wait()
+
+    message = MagicMock(spec=discord.Message)
+    message.edit = AsyncMock(side_effect=edit)
+    channel = MagicMock(spec=discord.TextChannel)
+    channel.get_partial_message = MagicMock(return_value=message)
+    bot = MagicMock(spec=discord.Client)
+    bot.get_channel = MagicMock(return_value=channel)
+    bot.get_user = MagicMock(return_value=MagicMock(display_name="Tester"))
+
+    def round_with_pot(amount):
+        return {
+            "betting": {
+                "open": False,
+                "locked": True,
+                "contestants": {"1": "Alice", "2": "Bob"},
+                "bets": {"0": {"amount": amount, "choice": "alice", "emoji": None}},
+            },
+            "live_message": 424242031,
+            "live_channel": 424242032,
+            "timer_end_time": None,
+        }
+
+    with patch("utils.live_message.save_data"):
+        first = asyncio.create_task(update_live_message(bot, round_with_pot(10)))
+        await started.wait()
+        stale = asyncio.create_task(update_live_message(bot, round_with_pot(20)))
+        latest = asyncio.create_task(update_live_message(bot, round_with_pot(30)))
+        # Let both queue up behind the edit that is still in flight
+        for _ in range(10):
+            await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, stale, latest)
+
+        assert len(sent) == 2
+        assert "`30`" in sent[-1]
+
+        clear_live_message_info(round_with_pot(30))
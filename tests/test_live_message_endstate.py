@@ -19,7 +19,7 @@ async def test_live_message_endstate_after_winner_declared():
     mock_channel = MagicMock(spec=discord.TextChannel)
     mock_message = AsyncMock(spec=discord.Message)
     mock_message.edit = AsyncMock()
-    mock_channel.fetch_message = AsyncMock(return_value=mock_message)
+    mock_channel.get_partial_message = MagicMock(return_value=mock_message)
     mock_bot.get_channel = MagicMock(return_value=mock_channel)
 
     # Minimal context mock
@@ -87,7 +87,7 @@ async def test_live_message_endstate_after_lock():
     mock_channel = MagicMock(spec=discord.TextChannel)
     mock_message = AsyncMock(spec=discord.Message)
     mock_message.edit = AsyncMock()
-    mock_channel.fetch_message = AsyncMock(return_value=mock_message)
+    mock_channel.get_partial_message = MagicMock(return_value=mock_message)
     mock_bot.get_channel = MagicMock(return_value=mock_channel)
 
     mock_ctx = MagicMock()
@@ -25,7 +25,7 @@ async def test_stress_rapid_lock_and_winner_cycles():
     mock_channel = MagicMock(spec=discord.TextChannel)
     mock_message = AsyncMock(spec=discord.Message)
     mock_message.edit = AsyncMock()
-    mock_channel.fetch_message = AsyncMock(return_value=mock_message)
+    mock_channel.get_partial_message = MagicMock(return_value=mock_message)
     mock_bot.get_channel = MagicMock(return_value=mock_channel)
 
     betting_cog = Betting(mock_bot)
@@ -106,6 +106,9 @@ def get_stdlib_modules() -> Set[str]:
         "email",
         "socket",
         "threading",
+        "queue",
+        "signal",
+        "atexit",
         "multiprocessing",
         "subprocess",
         "shutil",
@@ -242,6 +245,10 @@ def test_all_imports_in_requirements():
         if imp in ["dataclasses"]:  # dataclasses is stdlib in Python 3.7+
             continue
 
+        # Optional backends are imported lazily and listed commented out
+        if imp in ["redis"]:  # DATA_STORE_BACKEND=redis only
+            continue
+
         third_party_imports.add(normalize_package_name(imp))
 
     # Check for missing packages
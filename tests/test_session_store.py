@@ -0,0 +1,155 @@
+"""
+Tests for the pluggable data storage backends in data_manager.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+import data_manager
+from data_manager import (
+    JsonSessionStore,
+    MemorySessionStore,
+    RedisSessionStore,
+    load_data,
+    save_data,
+    set_session_store,
+)
+
+
+class FakeRedis:
+    """Minimal in-process stand-in for the redis-py hash commands we use."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.commands = []
+
+    def hgetall(self, key):
+        return {
+            k.encode("utf-8"): v.encode("utf-8")
+            for k, v in self.hashes.get(key, {}).items()
+        }
+
+    def hset(self, key, field, value):
+        self.commands.append(("hset", key, field))
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hdel(self, key, field):
+        self.commands.append(("hdel", key, field))
+        self.hashes.get(key, {}).pop(field, None)
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+
+@pytest.fixture
+def memory_store():
+    store = MemorySessionStore()
+    set_session_store(store)
+    yield store
+    set_session_store(None)
+
+
+def test_json_store_round_trip(tmp_path):
+    store = JsonSessionStore(str(tmp_path / "data.json"))
+    assert store.read() is None
+
+    store.write({"balances": {"1": 100}})
+    assert store.read() == {"balances": {"1": 100}}
+
+
+def test_json_store_follows_data_file(tmp_path, monkeypatch):
+    """The default JSON store resolves DATA_FILE at call time."""
+    data_file = tmp_path / "redirected.json"
+    monkeypatch.setattr(data_manager, "DATA_FILE", str(data_file))
+
+    JsonSessionStore().write({"balances": {}})
+    assert data_file.exists()
+
+
+def test_json_store_reuses_text_until_file_changes(tmp_path):
+    path = tmp_path / "data.json"
+    store = JsonSessionStore(str(path))
+    store.write({"balances": {"1": 100}})
+
+    with patch("builtins.open", side_effect=AssertionError("file reopened")):
+        assert store.read() == {"balances": {"1": 100}}
+
+    # An edit made outside the store invalidates the cached document
+    path.write_text('{"balances": {"1": 5, "2": 7}}', encoding="utf-8")
+    assert store.read() == {"balances": {"1": 5, "2": 7}}
+
+
+def test_json_store_unsaved_changes_do_not_leak(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_manager, "DATA_FILE", str(tmp_path / "data.json"))
+    set_session_store(JsonSessionStore())
+    try:
+        data = load_data()
+        data["balances"]["42"] = 1234
+
+        assert "42" not in load_data()["balances"]
+    finally:
+        set_session_store(None)
+
+
+def test_memory_store_returns_independent_copies():
+    store = MemorySessionStore()
+    store.write({"balances": {"1": 100}})
+
+    first = store.read()
+    first["balances"]["1"] = 0
+    assert store.read()["balances"]["1"] == 100
+
+
+def test_load_data_initializes_memory_store(memory_store):
+    data = load_data()
+    assert data["balances"] == {}
+    assert data["multi_session_mode"] is False
+
+    data["balances"]["42"] = 1234
+    save_data(data)
+    assert load_data()["balances"]["42"] == 1234
+
+
+def test_redis_store_writes_only_changed_fields():
+    client = FakeRedis()
+    store = RedisSessionStore(client, prefix="test")
+
+    store.write(
+        {
+            "balances": {"1": 100, "2": 200},
+            "betting_sessions": {},
+            "multi_session_mode": False,
+        }
+    )
+    assert store.read() == {
+        "balances": {"1": 100, "2": 200},
+        "betting_sessions": {},
+        "multi_session_mode": False,
+    }
+
+    client.commands.clear()
+    store.write(
+        {
+            "balances": {"1": 150},
+            "betting_sessions": {},
+            "multi_session_mode": False,
+        }
+    )
+    assert sorted(client.commands) == [
+        ("hdel", "test:balances", "2"),
+        ("hset", "test:balances", "1"),
+    ]
+    assert store.read()["balances"] == {"1": 150}
+
+
+def test_session_store_requires_read_and_write():
+    class IncompleteStore(data_manager.SessionStore):
+        def read(self):
+            return None
+
+    with pytest.raises(TypeError):
+        IncompleteStore()
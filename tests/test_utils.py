@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any, Optional
 import tempfile
 import json
+import time
 from pathlib import Path
 
 from data_manager import Data
@@ -20,12 +21,9 @@ from utils.bet_state import BetState, Economy
 @pytest.fixture
 def enhanced_test_data():
     """Enhanced test data with more realistic scenarios."""
-    import copy
+    from tests.conftest import fresh_test_data
 
-    # Import from the same module where it's defined
-    from tests.conftest import INITIAL_TEST_DATA
-
-    data = copy.deepcopy(INITIAL_TEST_DATA)
+    data = fresh_test_data()
 
     # Add more users with different balances
     data["balances"].update(
@@ -39,15 +37,15 @@ def enhanced_test_data():
     )
 
     # Set up an active betting round
-    data["betting"]["open"] = True
-    data["betting"]["contestants"] = {
-        "alice": "Alice",
-        "bob": "Bob",
-        "charlie": "Charlie",
-    }
-    data["betting"]["bets"] = {
-        "user1": {"amount": 100, "choice": "alice", "emoji": "🔥"}
-    }
+    data["betting"].update(
+        open=True,
+        contestants={
+            "alice": "Alice",
+            "bob": "Bob",
+            "charlie": "Charlie",
+        },
+        bets={"user1": {"amount": 100, "choice": "alice", "emoji": "🔥"}},
+    )
 
     return data
 
@@ -184,11 +182,11 @@ class PerformanceTimer:
         self.end_time: Optional[float] = None
 
     def __enter__(self):
-        self.start_time = asyncio.get_event_loop().time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self.end_time = asyncio.get_event_loop().time()
+        self.end_time = time.perf_counter()
         if self.start_time is not None and self.end_time is not None:
             elapsed = self.end_time - self.start_time
             assert (
@@ -325,3 +323,40 @@ def test_message_formatter_visual_improvements():
     # Should show all themed emojis with amounts
     for emoji, amount in amounts.items():
         assert f"{emoji} `{amount}`" in options_text
+
+
+def test_bet_summary_names_each_bettor_with_identical_bets():
+    """Test that identical bets from different users are attributed correctly."""
+    from utils.message_formatter import MessageFormatter
+
+    contestants = {"1": "Alice", "2": "Bob"}
+    bets = {
+        "111": {"amount": 100, "choice": "alice", "emoji": None},
+        "222": {"amount": 100, "choice": "alice", "emoji": None},
+        "333": {"amount": 50, "choice": "bob", "emoji": None},
+    }
+    user_names = {"111": "First", "222": "Second", "333": "Third"}
+
+    summary = MessageFormatter.format_bet_summary(contestants, bets, user_names)
+
+    assert "💰 **250** coins total" in summary
+    assert "**First** `100`" in summary
+    assert "**Second** `100`" in summary
+    assert "**Third** `50`" in summary
+
+
+def test_detailed_bet_list_caps_listed_bets():
+    """Test that only the largest bets are listed in the detailed bet list."""
+    from utils.message_formatter import DETAILED_BET_LIST_LIMIT, MessageFormatter
+
+    bets = {
+        str(i): {"amount": i, "choice": "alice", "emoji": None}
+        for i in range(1, DETAILED_BET_LIST_LIMIT + 6)
+    }
+    user_names = {user_id: f"User{user_id}" for user_id in bets}
+
+    detailed = MessageFormatter.format_detailed_bet_list(bets, user_names)
+
+    assert f"User{DETAILED_BET_LIST_LIMIT + 5}:" in detailed
+    assert "User5:" not in detailed
+    assert "…and 5 more bettors." in detailed
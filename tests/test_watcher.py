@@ -0,0 +1,68 @@
+"""
+Tests for the development file watcher's event filtering.
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("watchdog")
+from watchdog.events import FileModifiedEvent
+
+# The watcher is a standalone script rather than a package module
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import watcher
+
+
+@pytest.fixture
+def restarter():
+    """A BotRestarter that neither spawns the bot nor runs its debounce worker."""
+    with patch.object(watcher.BotRestarter, "_start_bot"), patch.object(
+        watcher.BotRestarter, "_debounce_loop"
+    ):
+        handler = watcher.BotRestarter("bot.py")
+    yield handler
+    handler.stop()
+
+
+class TestWatcherEventFilter:
+    """Test which file events schedule a bot restart."""
+
+    def _dispatch(self, handler, *parts):
+        handler.dispatch(FileModifiedEvent(os.path.join(watcher.BETBOT_DIR, *parts)))
+
+    def test_source_change_schedules_restart(self, restarter):
+        """Test that editing a .py file in the project schedules a restart."""
+        self._dispatch(restarter, "cogs", "betting.py")
+        assert restarter._last_change is not None
+
+    @pytest.mark.parametrize(
+        "parts",
+        [
+            (".venv", "lib", "python3.12", "site-packages", "foo", "bar.py"),
+            ("utils", "__pycache__", "x", "a.py"),
+            (".git", "hooks", "pre-commit.py"),
+            ("data.json",),
+        ],
+    )
+    def test_ignored_paths_do_not_schedule_restart(self, restarter, parts):
+        """Test that nested .venv/.git/__pycache__ and non-.py files are ignored."""
+        self._dispatch(restarter, *parts)
+        assert restarter._last_change is None
+
+
+class TestWatcherShutdown:
+    """Test that shutting the watcher down never leaves a bot running."""
+
+    def test_restart_after_stop_does_not_start_bot(self, restarter):
+        """Test that a restart racing with shutdown doesn't spawn a new bot."""
+        restarter.stop()
+
+        with patch.object(restarter, "_start_bot") as start_bot:
+            restarter._restart_bot_action()
+
+        start_bot.assert_not_called()
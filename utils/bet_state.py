@@ -2,11 +2,24 @@ from data_manager import Data, save_data, ensure_user
 from config import (
     COLOR_ERROR,
     BET_TIMER_DURATION,
+    STARTING_BALANCE,
     TITLE_BETTING_ERROR,
     MSG_BET_ALREADY_OPEN,
     MSG_BET_LOCKED,
 )
-from typing import Dict, Optional, TypedDict, cast, Any, List, Literal
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    NotRequired,
+    Optional,
+    Tuple,
+    TypedDict,
+    cast,
+)
+from itertools import compress
 from discord.ext import commands
 import discord
 import time
@@ -16,8 +29,9 @@ import time
 
 class BetInfo(TypedDict):
     amount: int
-    choice: str
+    choice: str  # Contestant name, stored lowercased by place_bet
     emoji: Optional[str]
+    choice_id: NotRequired[int]  # Numeric contestant key, used for settlement
 
 
 class UserResult(TypedDict):
@@ -57,12 +71,39 @@ class TimerInfo(TypedDict):
 TransactionType = Literal["add", "remove", "set"]
 
 
+def find_contestant_id(contestants: Dict[str, str], name_lower: str) -> Optional[int]:
+    """Returns the numeric key of the contestant named ``name_lower``, if any."""
+    for c_id, c_name in contestants.items():
+        if c_name.lower() == name_lower and c_id.isdigit():
+            return int(c_id)
+    return None
+
+
+def bet_is_on(bet: BetInfo, c_id: Optional[int], name_lower: str) -> bool:
+    """Whether ``bet`` backs the contestant with key ``c_id``/name ``name_lower``.
+
+    Bets carrying a ``choice_id`` are matched by key; older records and
+    sessions with non-numeric keys (multi-session 'c1'/'c2') fall back to
+    the lowercased name.
+    """
+    if c_id is not None and "choice_id" in bet:
+        return bet["choice_id"] == c_id
+    return bet["choice"].lower() == name_lower
+
+
 class Economy:
     """Centralized economy management."""
 
     def __init__(self, data: Data):
         self.data = data
 
+    def ensure_users(self, user_ids: Iterable[str]) -> None:
+        """Make sure every user in ``user_ids`` has a balance entry."""
+        balances = self.data["balances"]
+        for user_id in user_ids:
+            if user_id not in balances:
+                balances[user_id] = STARTING_BALANCE
+
     def get_balance(self, user_id: str) -> int:
         """Get a user's current balance, ensuring they exist in the system."""
         ensure_user(self.data, user_id)
@@ -109,16 +150,16 @@ class Economy:
     def process_bet_results(self, results: Dict[str, Any]) -> None:
         """Process bet results and update balances accordingly."""
         user_results = results["user_results"]
+        self.ensure_users(user_results.keys())
+        balances = self.data["balances"]
 
         # Update balances - for winners, add their total winnings (includes bet + profit)
         # For losers, winnings is 0 so balance stays as is (bet was already deducted)
         for user_id, result in user_results.items():
-            current_balance = self.get_balance(user_id)
             # result["winnings"] already includes the original bet amount for winners
-            new_balance = current_balance + result["winnings"]
-            self.set_balance(user_id, new_balance)
+            balances[user_id] += result["winnings"]
 
-        # Save changes
+        # Save changes once for the whole round
         save_data(self.data)
 
     def process_bet_placement(
@@ -158,8 +199,10 @@ class BetState:
 
     def update_data(self, data: Data) -> None:
         """Update the BetState with fresh data."""
+        if data is self.data:
+            return
         self.data = data
-        self.economy = Economy(data)
+        self.economy.data = data
 
     def get_betting_session(self) -> BettingSession:
         """Get current betting session state."""
@@ -199,6 +242,30 @@ class BetState:
     def bets(self) -> Dict[str, BetInfo]:
         return self.data["betting"].get("bets", {})
 
+    def _contestant_id(self, name_lower: str) -> Optional[int]:
+        """Returns the numeric key of the contestant named ``name_lower``."""
+        return find_contestant_id(self.contestants, name_lower)
+
+    def _bets_soa(
+        self, winner_name_lower: Optional[str] = None
+    ) -> Tuple[List[str], List[int], List[bool]]:
+        """Splits the current bets into parallel columns for settlement math.
+
+        Returns (user_ids, amounts, on_winner), where on_winner[i] is True if
+        bet i backs the winner (see ``bet_is_on``).
+        """
+        bets = self.bets
+        user_ids = list(bets.keys())
+        amounts = [bet["amount"] for bet in bets.values()]
+        if winner_name_lower is None:
+            on_winner = [False] * len(amounts)
+        else:
+            winner_id = self._contestant_id(winner_name_lower)
+            on_winner = [
+                bet_is_on(bet, winner_id, winner_name_lower) for bet in bets.values()
+            ]
+        return user_ids, amounts, on_winner
+
     def calculate_round_results(self, winner_name: Optional[str]) -> Dict[str, Any]:
         """Calculate all results for a betting round.
 
@@ -214,71 +281,45 @@ class BetState:
             - winning_users: List of user IDs who won
             - losing_users: List of user IDs who lost
         """
-        # Calculate pot totals
-        total_pot = sum(bet["amount"] for bet in self.bets.values())
+        # Settle on parallel columns rather than walking the bet dicts
+        winner_name_lower = winner_name.lower() if winner_name else None
+        user_ids, amounts, on_winner = self._bets_soa(winner_name_lower)
+
+        # Calculate pot totals (no winner means the pot is lost)
+        total_pot = sum(amounts)
+        winning_pot = sum(compress(amounts, on_winner))
+        bets_on_winner = sum(on_winner)
 
         # Initialize results
         user_results: Dict[str, UserResult] = {}
         winning_users: List[str] = []
         losing_users: List[str] = []
-
-        if not winner_name:  # Pot is lost
-            winning_pot = 0
-            bets_on_winner = 0
-
-            # Everyone loses their bets (which were already deducted)
-            for user_id, bet_info in self.bets.items():
-                bet_amount = bet_info["amount"]
-                current_balance = self.economy.get_balance(user_id)
-
-                user_results[user_id] = {
-                    "winnings": 0,
-                    "bet_amount": bet_amount,
-                    "new_balance": current_balance,  # No change needed, bet already deducted
-                    "net_change": -bet_amount,  # They lost their bet
-                }
+        self.economy.ensure_users(user_ids)
+        balances = self.data["balances"]
+
+        # Calculate individual results
+        for user_id, bet_amount, is_winner in zip(user_ids, amounts, on_winner):
+            current_balance = balances[user_id]
+
+            if is_winner and winning_pot > 0:
+                # Calculate winner's share of the total pot
+                winning_amount = bet_amount * total_pot // winning_pot
+                net_change = winning_amount - bet_amount
+                new_balance = current_balance + winning_amount
+                winning_users.append(user_id)
+            else:
+                # Losers keep their balance (the bet was already deducted)
+                winning_amount = 0
+                net_change = -bet_amount
+                new_balance = current_balance
                 losing_users.append(user_id)
 
-        else:  # We have a winner
-            winner_name_lower = winner_name.lower()
-
-            # Calculate winning pot and count winning bets
-            winning_pot = sum(
-                bet["amount"]
-                for bet in self.bets.values()
-                if bet["choice"].lower() == winner_name_lower
-            )
-
-            bets_on_winner = sum(
-                1
-                for bet in self.bets.values()
-                if bet["choice"].lower() == winner_name_lower
-            )
-
-            # Calculate individual results
-            for user_id, bet_info in self.bets.items():
-                bet_amount = bet_info["amount"]
-                current_balance = self.economy.get_balance(user_id)
-                is_winner = bet_info["choice"].lower() == winner_name_lower
-
-                if is_winner and winning_pot > 0:
-                    # Calculate winner's share of the total pot
-                    winning_amount = int((bet_amount / winning_pot) * total_pot)
-                    net_change = winning_amount - bet_amount
-                    new_balance = current_balance + winning_amount
-                    winning_users.append(user_id)
-                else:
-                    winning_amount = 0
-                    net_change = -bet_amount
-                    new_balance = current_balance
-                    losing_users.append(user_id)
-
-                user_results[user_id] = {
-                    "winnings": winning_amount,
-                    "bet_amount": bet_amount,
-                    "new_balance": new_balance,
-                    "net_change": net_change,
-                }
+            user_results[user_id] = {
+                "winnings": winning_amount,
+                "bet_amount": bet_amount,
+                "new_balance": new_balance,
+                "net_change": net_change,
+            }
 
         return {
             "total_pot": total_pot,
@@ -296,11 +337,14 @@ class BetState:
     def get_contestant_totals(self) -> Dict[str, int]:
         """Calculate total bets per contestant."""
         totals = {contestant_id: 0 for contestant_id in self.contestants.keys()}
+        # Bet choices are stored lowercased, so match against lowered names
+        id_by_name: Dict[str, str] = {}
+        for c_id, c_name in self.contestants.items():
+            id_by_name.setdefault(c_name.lower(), c_id)
         for bet in self.bets.values():
-            for c_id, c_name in self.contestants.items():
-                if bet["choice"] == c_name.lower():
-                    totals[c_id] += bet["amount"]
-                    break
+            c_id = id_by_name.get(bet["choice"])
+            if c_id is not None:
+                totals[c_id] += bet["amount"]
         return totals
 
     def get_user_bet(self, user_id: str) -> Optional[BetInfo]:
@@ -366,11 +410,12 @@ class BetState:
             return False
 
         # Record the new bet
-        self.data["betting"]["bets"][user_id] = {
-            "amount": amount,
-            "choice": choice.lower(),
-            "emoji": emoji,
-        }
+        choice_lower = choice.lower()
+        bet: BetInfo = {"amount": amount, "choice": choice_lower, "emoji": emoji}
+        choice_id = self._contestant_id(choice_lower)
+        if choice_id is not None:
+            bet["choice_id"] = choice_id
+        self.data["betting"]["bets"][user_id] = bet
         save_data(self.data)
         return True
 
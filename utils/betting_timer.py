@@ -7,6 +7,7 @@ from typing import Optional
 from discord.ext import commands
 
 
+from config import MSG_BETTING_TIMER_EXPIRED_SUMMARY
 from data_manager import Data, save_data, load_data
 from utils.live_message import update_live_message, schedule_live_message_update
 from utils.logger import logger
@@ -19,6 +20,7 @@ class BettingTimer:
         self.bot = bot
         self.timer_task: Optional[asyncio.Task] = None
         self.timeout_callback = None
+        self._lock_event = asyncio.Event()
 
     def cancel_timer(self):
         """Cancel the current betting timer."""
@@ -26,6 +28,10 @@ class BettingTimer:
             self.timer_task.cancel()
             logger.info("Betting timer cancelled")
 
+    def notify_locked(self):
+        """Wake the running timer because betting was locked elsewhere."""
+        self._lock_event.set()
+
     def clear_timer_state_in_data(self, data: Data) -> None:
         """Clears timer-related data."""
         data["timer_end_time"] = None
@@ -36,6 +42,7 @@ class BettingTimer:
     ):
         """Start a betting timer for the specified duration."""
         self.timeout_callback = timeout_callback
+        self._lock_event = asyncio.Event()
         self.timer_task = asyncio.create_task(self._run_timer(ctx, total_duration))
         logger.info(f"Betting timer started for {total_duration} seconds")
 
@@ -52,17 +59,12 @@ class BettingTimer:
 
             # Update live message periodically (only on 5s/0s intervals)
             last_update_time = None
-            while time_module.time() < end_time:
-                current_time = time_module.time()
-                remaining_time = int(end_time - current_time)
-
-                data = load_data()
-
-                # Check if betting was manually locked
-                if data["betting"]["locked"]:
-                    logger.info("Timer stopped - betting was manually locked")
-                    self.clear_timer_state_in_data(data)
-                    return
+            while True:
+                # One clock read per tick, shared by the checks and the update
+                now = time_module.time()
+                if now >= end_time:
+                    break
+                remaining_time = int(end_time - now)
 
                 # Only update live message when remaining time ends in 5 or 0
                 should_update = remaining_time % 10 == 5 or remaining_time % 10 == 0
@@ -72,14 +74,34 @@ class BettingTimer:
                 if should_update and (
                     last_update_time is None or remaining_time != last_update_time
                 ):
+                    data = load_data()
+
+                    # Fallback for locks that didn't go through notify_locked
+                    if data["betting"]["locked"]:
+                        logger.info("Timer stopped - betting was manually locked")
+                        self.clear_timer_state_in_data(data)
+                        return
+
                     # Use direct update for timer displays to ensure accurate
                     # countdown
-                    await update_live_message(self.bot, data, current_time=current_time)
+                    await update_live_message(self.bot, data, current_time=now)
                     last_update_time = remaining_time
                     logger.info(f"Timer update: {remaining_time} seconds remaining")
 
-                # Check every second but only update on 5s/0s intervals
-                await asyncio.sleep(1)
+                # Sleep until the remaining time drops to the next 5s/0s mark
+                # (or to expiry after the last one), or stop early if betting
+                # gets locked. The delay is measured against the deadline with
+                # a fresh clock read, so a slow edit doesn't push us past it.
+                next_mark = remaining_time - (remaining_time % 5 or 5)
+                wake_at = end_time - (next_mark + 1) if next_mark >= 0 else end_time
+                delay = max(0.0, wake_at - time_module.time())
+                try:
+                    await asyncio.wait_for(self._lock_event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    continue
+                logger.info("Timer stopped - betting was manually locked")
+                self.clear_timer_state_in_data(load_data())
+                return
 
             # Timer expired - auto-lock bets
             data = load_data()
@@ -104,8 +126,6 @@ class BettingTimer:
 
     async def _auto_lock_bets(self, ctx: commands.Context, data: Data):
         """Automatically lock bets when timer expires."""
-        from config import MSG_BETTING_TIMER_EXPIRED_SUMMARY
-
         logger.info("Betting timer expired - auto-locking bets")
 
         # Lock the bets
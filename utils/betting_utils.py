@@ -76,13 +76,11 @@ class BettingUtils:
             + data["contestant_2_emojis"]
         )
 
-        for i, emoji in enumerate(all_emojis_to_add):
+        # Reactions display in the order they are added, so add them one at a
+        # time. discord.py's route rate limiter paces the requests.
+        for emoji in all_emojis_to_add:
             try:
                 await message.add_reaction(emoji)
-                # Add a small delay between reactions to avoid rate limiting
-                # Discord allows roughly 1 reaction per 0.25 seconds
-                if i < len(all_emojis_to_add) - 1:  # Don't delay after the last emoji
-                    await asyncio.sleep(0.3)
             except discord.HTTPException as e:
                 if "rate limited" in str(e).lower() or "429" in str(e):
                     # If we're rate limited, wait longer and retry once
@@ -109,12 +107,11 @@ class BettingUtils:
         exclude_emoji: Optional[str] = None,
     ) -> None:
         """Removes all betting reactions from a specific user on a message."""
-        all_betting_emojis = data["contestant_1_emojis"] + data["contestant_2_emojis"]
+        import asyncio
 
-        for emoji_str in all_betting_emojis:
-            if emoji_str == exclude_emoji:
-                continue  # Skip the emoji that was just added
+        all_betting_emojis = data["contestant_1_emojis"] + data["contestant_2_emojis"]
 
+        async def remove(emoji_str: str) -> None:
             try:
                 await message.remove_reaction(emoji_str, user)
             except discord.NotFound:
@@ -124,3 +121,12 @@ class BettingUtils:
                     f"Failed to remove reaction {emoji_str} from user {
                         user.name}: {e}"
                 )
+
+        # Each emoji is its own route, so the removals can run concurrently
+        await asyncio.gather(
+            *(
+                remove(emoji_str)
+                for emoji_str in all_betting_emojis
+                if emoji_str != exclude_emoji
+            )
+        )
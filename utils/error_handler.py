@@ -3,9 +3,12 @@ Centralized error handling and recovery system.
 """
 
 import asyncio
+import weakref
 import discord
+from collections import Counter, OrderedDict
 from datetime import datetime
 from functools import wraps
+from typing import Callable, Dict
 
 from utils.logger import logger
 
@@ -34,12 +37,85 @@ class RateLimitError(BotError):
     pass
 
 
+def _not_found_embed(error: Exception) -> discord.Embed:
+    return discord.Embed(
+        title="❌ Message Not Found",
+        description="The message or channel couldn't be found. It may have been deleted.",
+        color=discord.Color.red(),
+    )
+
+
+def _forbidden_embed(error: Exception) -> discord.Embed:
+    return discord.Embed(
+        title="❌ Permission Error",
+        description="I don't have permission to perform this action.",
+        color=discord.Color.red(),
+    )
+
+
+def _betting_error_embed(error: Exception) -> discord.Embed:
+    return discord.Embed(
+        title="❌ Betting Error",
+        description=str(error),
+        color=discord.Color.red(),
+    )
+
+
+def _rate_limit_embed(error: Exception) -> discord.Embed:
+    return discord.Embed(
+        title="⏰ Rate Limited",
+        description=str(error),
+        color=discord.Color.orange(),
+    )
+
+
+def _generic_error_embed(error: Exception) -> discord.Embed:
+    embed = discord.Embed(
+        title="❌ Something went wrong",
+        description="An unexpected error occurred. The issue has been logged.",
+        color=discord.Color.red(),
+    )
+    embed.add_field(name="Error ID", value=f"`{id(error)}`", inline=False)
+    return embed
+
+
+_ERROR_EMBEDS: Dict[type, Callable[[Exception], discord.Embed]] = {
+    discord.errors.NotFound: _not_found_embed,
+    discord.errors.Forbidden: _forbidden_embed,
+    BettingError: _betting_error_embed,
+    RateLimitError: _rate_limit_embed,
+}
+
+
+# Resolved builder per error class. Weak keys let exception classes defined
+# at runtime (e.g. in tests or reloaded cogs) be collected with their entry.
+_resolved_embed_builders: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _embed_builder_for(error_type: type) -> Callable[[Exception], discord.Embed]:
+    """Resolves the embed builder for an error class, honouring subclasses."""
+    builder = _resolved_embed_builders.get(error_type)
+    if builder is not None:
+        return builder
+
+    builder = _generic_error_embed
+    for klass in error_type.__mro__:
+        if klass in _ERROR_EMBEDS:
+            builder = _ERROR_EMBEDS[klass]
+            break
+    _resolved_embed_builders[error_type] = builder
+    return builder
+
+
 class ErrorHandler:
     """Centralized error handling system."""
 
+    # Most error types whose last-seen time is kept; the oldest is evicted
+    MAX_TRACKED_ERROR_TYPES = 128
+
     def __init__(self):
-        self.error_counts = {}
-        self.last_errors = {}
+        self.error_counts: Counter = Counter()
+        self.last_errors: "OrderedDict[str, datetime]" = OrderedDict()
 
     async def handle_command_error(self, ctx, error: Exception):
         """Handle command errors with user-friendly messages."""
@@ -49,42 +125,15 @@ class ErrorHandler:
 
         # Track error frequency
         error_type = type(error).__name__
-        self.error_counts[error_type] = self.error_counts.get(error_type, 0) + 1
+        self.error_counts[error_type] += 1
         self.last_errors[error_type] = datetime.now()
+        self.last_errors.move_to_end(error_type)
+        if len(self.last_errors) > self.MAX_TRACKED_ERROR_TYPES:
+            stale_type, _ = self.last_errors.popitem(last=False)
+            del self.error_counts[stale_type]
 
         # Create user-friendly embed
-        if isinstance(error, discord.errors.NotFound):
-            embed = discord.Embed(
-                title="❌ Message Not Found",
-                description="The message or channel couldn't be found. It may have been deleted.",
-                color=discord.Color.red(),
-            )
-        elif isinstance(error, discord.errors.Forbidden):
-            embed = discord.Embed(
-                title="❌ Permission Error",
-                description="I don't have permission to perform this action.",
-                color=discord.Color.red(),
-            )
-        elif isinstance(error, BettingError):
-            embed = discord.Embed(
-                title="❌ Betting Error",
-                description=str(error),
-                color=discord.Color.red(),
-            )
-        elif isinstance(error, RateLimitError):
-            embed = discord.Embed(
-                title="⏰ Rate Limited",
-                description=str(error),
-                color=discord.Color.orange(),
-            )
-        else:
-            # Generic error
-            embed = discord.Embed(
-                title="❌ Something went wrong",
-                description="An unexpected error occurred. The issue has been logged.",
-                color=discord.Color.red(),
-            )
-            embed.add_field(name="Error ID", value=f"`{id(error)}`", inline=False)
+        embed = _embed_builder_for(type(error))(error)
 
         try:
             await ctx.send(embed=embed)
@@ -109,7 +158,7 @@ class ErrorHandler:
     def get_error_stats(self) -> dict:
         """Get error statistics for monitoring."""
         return {
-            "error_counts": self.error_counts.copy(),
+            "error_counts": dict(self.error_counts),
             "last_errors": {k: v.isoformat() for k, v in self.last_errors.items()},
         }
 
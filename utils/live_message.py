@@ -4,15 +4,20 @@ from config import (
     LIVE_SECONDARY_KEY,
     LIVE_SECONDARY_CHANNEL_KEY,
     BET_TIMER_DURATION,
+    STARTING_BALANCE,
 )
 import discord
+import json
 import time
 import asyncio
+import weakref
+from collections import OrderedDict
 from typing import Optional, Tuple, Dict, Any, cast, List, Set
 
+import data_manager
 from data_manager import save_data, Data
 from .message_formatter import MessageFormatter
-from .bet_state import WinnerInfo, BettingSession, TimerInfo
+from .bet_state import WinnerInfo, BettingSession, TimerInfo, UserResult
 
 
 class LiveMessageScheduler:
@@ -21,7 +26,7 @@ class LiveMessageScheduler:
     def __init__(self):
         # Set of data file paths needing updates
         self.pending_updates: Set[str] = set()
-        # Skip batched update until this timestamp (epoch seconds). Used to
+        # Skip batched update until this time.monotonic() value. Used to
         # avoid overwriting immediate special embeds (winner/locked) with a
         # subsequent batched update.
         self.skip_until: float = 0.0
@@ -43,11 +48,12 @@ class LiveMessageScheduler:
         # to prevent the batched update from overwriting a special immediate
         # update, they should call `suppress_next_batched_update`.
 
-        # Start the update loop if not already running
+        # Start the update loop if not already running. While it runs, further
+        # calls only add to pending_updates. is_running is cleared only once
+        # the previous loop has exited or been cancelled by stop(), so there
+        # is never an old task left to cancel here.
         if not self.is_running:
             self.is_running = True
-            if self.update_task:
-                self.update_task.cancel()
             self.update_task = asyncio.create_task(self._update_loop())
 
     async def _update_loop(self) -> None:
@@ -58,25 +64,23 @@ class LiveMessageScheduler:
 
                 if self.pending_updates:
                     # Process all pending updates in one batch
-                    updates_to_process = self.pending_updates.copy()
-                    self.pending_updates.clear()
-
-                    # Load current data and update all pending messages
-                    from data_manager import load_data
-
-                    data = load_data()
+                    # Swap in a fresh set rather than copying and clearing;
+                    # nothing can interleave as there is no await in between
+                    updates_to_process = self.pending_updates
+                    self.pending_updates = set()
 
                     # If a recent immediate special update (winner/close) was
                     # performed, skip calling update_live_message here so we do
-                    # not overwrite the special embed. Clear pending updates
-                    # and continue.
-                    import time as _time
-
-                    if _time.time() < self.skip_until:
+                    # not overwrite the special embed. Checked before loading
+                    # the data so a suppressed batch costs nothing.
+                    if time.monotonic() < self.skip_until:
                         # Clear any pending markers and continue to next loop
                         self.pending_updates.difference_update(updates_to_process)
                         continue
 
+                    # Load current data and update all pending messages
+                    data = data_manager.load_data()
+
                     # Update live message with the current state
                     await update_live_message(self.bot, data)
 
@@ -98,6 +102,87 @@ class LiveMessageScheduler:
 # Global scheduler instance
 live_message_scheduler = LiveMessageScheduler()
 
+# Last embed payload sent to each live message and when it was sent, keyed by
+# message ID. Used to skip edits that would not change what the message shows.
+_last_sent_embeds: Dict[int, Tuple[Dict[str, Any], float]] = {}
+
+# How long an unchanged embed is trusted before it is sent again anyway, so a
+# message edited or reset outside the bot is eventually corrected
+EMBED_RESEND_INTERVAL = 300.0
+
+# Per-message edit lock and count of edits requested, keyed by message ID.
+# Edits to one message never overlap, and an edit that is superseded while
+# waiting for the lock is dropped instead of sending a stale embed.
+_edit_locks: Dict[int, asyncio.Lock] = {}
+_edit_requests: Dict[int, int] = {}
+
+# Inputs and result of the most recent embed render, as
+# (render key, embed, embed payload)
+_last_render: Optional[Tuple[str, discord.Embed, Dict[str, Any]]] = None
+
+# How long a fetched display name is reused before asking Discord again
+USER_NAME_CACHE_TTL = 300.0
+# Most display names kept per bot; the oldest entry is evicted beyond this
+USER_NAME_CACHE_MAX = 1000
+
+# Per-bot display name cache (user ID -> (name, expires_at)) and the fetches
+# currently in flight, so concurrent updates share a single fetch_user call.
+# Only users missing from the client's own cache are fetched.
+_user_name_cache: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_user_name_inflight: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+# Guild used for live message links, per bot. bot.guilds builds a new list on
+# every access, so the first guild's ID is looked up once and reused.
+_link_guild_ids: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def _fetch_display_name(bot: discord.Client, user_id: int) -> str:
+    """Fetches a user's display name from Discord and caches successes."""
+    try:
+        user = await bot.fetch_user(user_id)
+    except discord.NotFound:
+        return f"Unknown User ({user_id})"
+    except Exception:
+        return f"User ({user_id})"
+
+    now = time.monotonic()
+    cache = _user_name_cache.setdefault(bot, OrderedDict())
+    cache[user_id] = (user.display_name, now + USER_NAME_CACHE_TTL)
+    cache.move_to_end(user_id)
+    # Every entry has the same TTL, so the cache is ordered by expiry: drop
+    # expired names from the front, then trim to the size cap
+    while cache:
+        oldest_id, (_, expires_at) = next(iter(cache.items()))
+        if expires_at > now and len(cache) <= USER_NAME_CACHE_MAX:
+            break
+        del cache[oldest_id]
+    return user.display_name
+
+
+async def _get_display_name(bot: discord.Client, user_id: str) -> str:
+    """Returns a user's display name, from cache or a shared in-flight fetch."""
+    try:
+        uid = int(user_id)
+    except ValueError:
+        return f"User ({user_id})"
+    cached = _user_name_cache.get(bot, {}).get(uid)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    # Users already in the client's cache need no HTTP request at all
+    user = bot.get_user(uid)
+    if user is not None:
+        return user.display_name
+
+    inflight = _user_name_inflight.setdefault(bot, {})
+    task = inflight.get(uid)
+    if task is None:
+        task = asyncio.create_task(_fetch_display_name(bot, uid))
+        inflight[uid] = task
+        task.add_done_callback(lambda _: inflight.pop(uid, None))
+    # Shield so one cancelled caller doesn't cancel the fetch for the others
+    return await asyncio.shield(task)
+
 
 # State conversion utilities (moved from state_converter.py)
 def convert_to_betting_session(data: Data) -> BettingSession:
@@ -114,60 +199,40 @@ def convert_to_betting_session(data: Data) -> BettingSession:
 def create_winner_info(
     winner_name: Optional[str], winnings_info: Optional[Dict[str, int]] = None
 ) -> Optional[WinnerInfo]:
-    """Legacy function for backward compatibility. Now uses BetState."""
+    """Legacy function for backward compatibility. Settles like BetState."""
     if not winner_name:
         return None
 
     if winnings_info is None:
         winnings_info = {}
 
-    # Create a minimal bet state with just the necessary data
-    from .bet_state import BetState
-    from typing import TypedDict
-
-    class UserBet(TypedDict):
-        amount: int
-        choice: str
-        emoji: Optional[str]
-
-    data = cast(
-        Data,
-        {
-            "betting": {
-                "bets": {
-                    user_id: {
-                        "amount": abs(winnings) if winnings <= 0 else winnings // 2,
-                        "choice": winner_name.lower() if winnings > 0 else "other",
-                        "emoji": None,
-                    }
-                    for user_id, winnings in winnings_info.items()
-                },
-                "open": False,
-                "locked": True,
-                "contestants": {},
-            },
-            "balances": {},
-            "settings": {},
-            "reaction_bet_amounts": {},
-            "contestant_1_emojis": [],
-            "contestant_2_emojis": [],
-            "live_message": None,
-            "live_channel": None,
-            "live_secondary_message": None,
-            "live_secondary_channel": None,
-            "timer_end_time": None,
-        },
-    )
-
-    # Use the centralized calculation
-    bet_state = BetState(data)
-    results = bet_state.calculate_round_results(winner_name)
+    # Rebuild each bet from its net winnings: winners doubled their stake,
+    # losers lost it. Then settle with the same integer share as BetState.
+    bets = [
+        (user_id, winnings // 2 if winnings > 0 else abs(winnings), winnings > 0)
+        for user_id, winnings in winnings_info.items()
+    ]
+    total_pot = sum(amount for _, amount, _ in bets)
+    winning_pot = sum(amount for _, amount, is_winner in bets if is_winner)
+
+    user_results: Dict[str, UserResult] = {}
+    for user_id, bet_amount, is_winner in bets:
+        if is_winner and winning_pot > 0:
+            winning_amount = bet_amount * total_pot // winning_pot
+        else:
+            winning_amount = 0
+        user_results[user_id] = {
+            "winnings": winning_amount,
+            "bet_amount": bet_amount,
+            "new_balance": STARTING_BALANCE + winning_amount,
+            "net_change": winning_amount - bet_amount,
+        }
 
     return {
         "name": winner_name,
-        "total_pot": results["total_pot"],
-        "winning_pot": results["winning_pot"],
-        "user_results": results["user_results"],
+        "total_pot": total_pot,
+        "winning_pot": winning_pot,
+        "user_results": user_results,
     }
 
 
@@ -210,39 +275,65 @@ def get_saved_bet_channel_id(data: Data) -> Optional[int]:
 
 
 def set_live_message_info(
-    data: Data, message_id: Optional[int], channel_id: Optional[int]
+    data: Data,
+    message_id: Optional[int],
+    channel_id: Optional[int],
+    save: bool = True,
 ) -> None:
-    """Sets the main live message ID and channel ID."""
+    """Sets the main live message ID and channel ID.
+
+    Pass save=False when the caller saves the data itself right after.
+    """
     data[LIVE_MESSAGE_KEY] = message_id
     data[LIVE_CHANNEL_KEY] = channel_id
-    save_data(data)
+    if save:
+        save_data(data)
 
 
 def set_secondary_live_message_info(
-    data: Data, message_id: Optional[int], channel_id: Optional[int]
+    data: Data,
+    message_id: Optional[int],
+    channel_id: Optional[int],
+    save: bool = True,
 ) -> None:
-    """Sets the secondary live message ID and channel ID."""
+    """Sets the secondary live message ID and channel ID.
+
+    Pass save=False when the caller saves the data itself right after.
+    """
     data[LIVE_SECONDARY_KEY] = message_id
     data[LIVE_SECONDARY_CHANNEL_KEY] = channel_id
-    save_data(data)
+    if save:
+        save_data(data)
+
 
+def clear_live_message_info(data: Data, save: bool = True) -> None:
+    """Clears all live message information.
 
-def clear_live_message_info(data: Data) -> None:
-    """Clears all live message information."""
+    Pass save=False when the caller saves the data itself right after.
+    """
+    for key in (LIVE_MESSAGE_KEY, LIVE_SECONDARY_KEY):
+        msg_id = data.get(key)
+        _last_sent_embeds.pop(msg_id, None)
+        _edit_locks.pop(msg_id, None)
+        _edit_requests.pop(msg_id, None)
     data[LIVE_MESSAGE_KEY] = None
     data[LIVE_CHANNEL_KEY] = None
     data[LIVE_SECONDARY_KEY] = None
     data[LIVE_SECONDARY_CHANNEL_KEY] = None
-    save_data(data)
+    if save:
+        save_data(data)
 
 
 def get_live_message_link(bot: discord.Client, data: Data, is_active: bool) -> str:
     """Generates a link to the live betting message if it exists."""
     msg_id, chan_id = get_live_message_info(data)
     if msg_id and chan_id:
+        guild_id = _link_guild_ids.get(bot)
         # Safely get guild ID, assuming the bot is in at least one guild
-        if bot.guilds:
+        if guild_id is None and bot.guilds:
             guild_id = bot.guilds[0].id  # Using the first guild the bot is in
+            _link_guild_ids[bot] = guild_id
+        if guild_id is not None:
             return f"[Go to Live Betting Message](https://discord.com/channels/{guild_id}/{chan_id}/{msg_id})"
     return ""
 
@@ -280,16 +371,21 @@ async def _remove_all_betting_reactions(
 ) -> None:
     """Removes all betting-related reactions from a specific user on a message."""
     all_betting_emojis = data["contestant_1_emojis"] + data["contestant_2_emojis"]
-    for emoji_str in all_betting_emojis:
-        try:
-            await message.remove_reaction(emoji_str, user)
-        except discord.NotFound:
-            pass
-        except discord.HTTPException as e:
+    # Issue the removals concurrently rather than one round-trip at a time
+    results = await asyncio.gather(
+        *(message.remove_reaction(emoji_str, user) for emoji_str in all_betting_emojis),
+        return_exceptions=True,
+    )
+    for emoji_str, result in zip(all_betting_emojis, results):
+        if isinstance(result, discord.NotFound):
+            continue
+        if isinstance(result, discord.HTTPException):
             print(
                 f"Error removing reaction {emoji_str} from user {
-                    user.name}: {e}"
+                    user.name}: {result}"
             )
+        elif isinstance(result, BaseException):
+            raise result
 
 
 async def update_live_message(
@@ -314,18 +410,24 @@ async def update_live_message(
     if not messages_to_update:
         return
 
+    # Resolve the channels first; if none of them is reachable there is
+    # nothing to edit, so skip the name lookups and rendering entirely
+    live_channels: List[Tuple[int, int, discord.TextChannel]] = []
+    for msg_id, chan_id in messages_to_update:
+        channel = bot.get_channel(chan_id) if chan_id else None
+        if msg_id and isinstance(channel, discord.TextChannel):
+            live_channels.append((msg_id, chan_id, channel))
+    if not live_channels:
+        return
+
     betting_session = convert_to_betting_session(data)
 
-    # Get user names for the bets
-    user_names = {}
-    for user_id in betting_session["bets"].keys():
-        try:
-            user = await bot.fetch_user(int(user_id))
-            user_names[user_id] = user.display_name
-        except discord.NotFound:
-            user_names[user_id] = f"Unknown User ({user_id})"
-        except Exception:
-            user_names[user_id] = f"User ({user_id})"
+    # Get user names for the bets, looking all bettors up concurrently
+    bettor_ids = list(betting_session["bets"].keys())
+    names = await asyncio.gather(
+        *(_get_display_name(bot, user_id) for user_id in bettor_ids)
+    )
+    user_names = dict(zip(bettor_ids, names))
 
     # Calculate timer info if betting is open and timer is enabled
     timer_info = None
@@ -336,40 +438,101 @@ async def update_live_message(
         remaining_time = int(timer_end_time_val - actual_current_time)
         timer_info = create_timer_info(max(0, remaining_time), BET_TIMER_DURATION)
 
-    new_embed = await MessageFormatter.create_live_message_embed(
-        betting_session=betting_session,
-        emoji_config=get_emoji_config(data),
-        reaction_amounts=get_reaction_bet_amounts(data),
-        user_names=user_names,
-        current_time=current_time,
-        timer_info=timer_info,
-        betting_closed=betting_closed,
-        close_summary=close_summary,
-        winner_info=winner_info if winner_declared else None,
+    global _last_render
+    emoji_config = get_emoji_config(data)
+    reaction_amounts = get_reaction_bet_amounts(data)
+    shown_winner_info = winner_info if winner_declared else None
+
+    # Everything the embed depends on; identical inputs reuse the last render
+    render_key = json.dumps(
+        [
+            betting_session,
+            emoji_config,
+            reaction_amounts,
+            user_names,
+            timer_info,
+            betting_closed,
+            close_summary,
+            shown_winner_info,
+        ],
+        sort_keys=True,
+        default=str,
     )
-
-    for msg_id, chan_id in messages_to_update:
-        if msg_id and chan_id:
-            channel = bot.get_channel(chan_id)
-            if channel and isinstance(channel, discord.TextChannel):
-                try:
-                    message = await channel.fetch_message(msg_id)
-                    await message.edit(embed=new_embed)
-                except discord.NotFound:
-                    print(
-                        f"Live message {msg_id} not found in channel {chan_id}. Clearing info."
-                    )
-                    if msg_id == main_msg_id:
-                        data[LIVE_MESSAGE_KEY] = None
-                        data[LIVE_CHANNEL_KEY] = None
-                    elif msg_id == secondary_msg_id:
-                        data[LIVE_SECONDARY_KEY] = None
-                        data[LIVE_SECONDARY_CHANNEL_KEY] = None
-                    save_data(data)
-                except discord.HTTPException as e:
-                    print(
-                        f"Error updating live message {msg_id} in channel {chan_id}: {e}"
-                    )
+    if _last_render is not None and _last_render[0] == render_key:
+        new_embed, embed_payload = _last_render[1], _last_render[2]
+    else:
+        new_embed = await MessageFormatter.create_live_message_embed(
+            betting_session=betting_session,
+            emoji_config=emoji_config,
+            reaction_amounts=reaction_amounts,
+            user_names=user_names,
+            current_time=current_time,
+            timer_info=timer_info,
+            betting_closed=betting_closed,
+            close_summary=close_summary,
+            winner_info=shown_winner_info,
+        )
+        embed_payload = new_embed.to_dict()
+        _last_render = (render_key, new_embed, embed_payload)
+
+    async def _do_edit(
+        msg_id: int, chan_id: int, channel: discord.TextChannel
+    ) -> Optional[int]:
+        """Edits one live message, returning its ID if it no longer exists."""
+        request = _edit_requests[msg_id] = _edit_requests.get(msg_id, 0) + 1
+        async with _edit_locks.setdefault(msg_id, asyncio.Lock()):
+            if _edit_requests.get(msg_id) != request:
+                return None  # A newer update for this message is waiting
+
+            last_sent = _last_sent_embeds.get(msg_id)
+            if (
+                last_sent is not None
+                and last_sent[0] == embed_payload
+                and time.monotonic() - last_sent[1] < EMBED_RESEND_INTERVAL
+            ):
+                return None  # Message already shows exactly this embed
+
+            try:
+                # Edit through a partial message: one PATCH, no prior GET.
+                # discord.py waits out rate limits and retries 429s itself.
+                await channel.get_partial_message(msg_id).edit(embed=new_embed)
+                _last_sent_embeds[msg_id] = (embed_payload, time.monotonic())
+            except discord.NotFound:
+                _last_sent_embeds.pop(msg_id, None)
+                print(
+                    f"Live message {msg_id} not found in channel {chan_id}. Clearing info."
+                )
+                return msg_id
+            except discord.HTTPException as e:
+                print(
+                    f"Error updating live message {msg_id} in channel {chan_id}: {e}"
+                )
+            return None
+
+    # Main and secondary messages live in different channels, so edit them
+    # concurrently and apply any cleanup once both edits have finished
+    results = await asyncio.gather(
+        *(
+            _do_edit(msg_id, chan_id, channel)
+            for msg_id, chan_id, channel in live_channels
+        ),
+        return_exceptions=True,
+    )
+    missing = set()
+    for result in results:
+        if isinstance(result, BaseException):
+            print(f"Error updating live message: {result}")
+        elif result is not None:
+            missing.add(result)
+
+    if missing:
+        if main_msg_id in missing:
+            data[LIVE_MESSAGE_KEY] = None
+            data[LIVE_CHANNEL_KEY] = None
+        if secondary_msg_id in missing:
+            data[LIVE_SECONDARY_KEY] = None
+            data[LIVE_SECONDARY_CHANNEL_KEY] = None
+        save_data(data)
 
 
 def schedule_live_message_update() -> None:
@@ -387,14 +550,13 @@ def suppress_next_batched_update(seconds: float = 6.0) -> None:
     This is used to avoid the batched update overwriting a special immediate
     update (for example, winner or locked embeds) that was just posted.
     """
-    import time
     from config import LIVE_MESSAGE_SUPPRESSION_SECONDS
 
     # If caller didn't provide a value, use the configured default
     if seconds is None:
         seconds = LIVE_MESSAGE_SUPPRESSION_SECONDS
 
-    live_message_scheduler.skip_until = time.time() + seconds
+    live_message_scheduler.skip_until = time.monotonic() + seconds
 
 
 def initialize_live_message_scheduler(bot: discord.Client) -> None:
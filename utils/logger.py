@@ -2,14 +2,20 @@
 Centralized logging configuration for the betting bot.
 """
 
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 
 def setup_logger(name: str = "betbot", level: int = logging.INFO) -> logging.Logger:
-    """Setup centralized logging with file rotation."""
+    """Setup centralized logging with file rotation.
+
+    Records are handed to a queue and written by a background listener
+    thread, so logging from the event loop never blocks on disk I/O.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
@@ -38,8 +44,15 @@ def setup_logger(name: str = "betbot", level: int = logging.INFO) -> logging.Log
     console_handler.setLevel(logging.WARNING)
     console_handler.setFormatter(formatter)
 
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(listener.stop)
+
+    logger.addHandler(QueueHandler(log_queue))
 
     return logger
 
@@ -1,7 +1,14 @@
-from typing import List, Dict, Optional, Any, Mapping
+from typing import List, Dict, Optional, Any, Mapping, Tuple
 import discord
-import math
-from .bet_state import BetInfo, WinnerInfo, BettingSession, TimerInfo
+import heapq
+from .bet_state import (
+    BetInfo,
+    WinnerInfo,
+    BettingSession,
+    TimerInfo,
+    bet_is_on,
+    find_contestant_id,
+)
 from config import (
     CONTESTANT_EMOJIS,
     MSG_NO_BETS_PLACED_YET,
@@ -17,6 +24,12 @@ from config import (
     COLOR_DARK_GRAY,
 )
 
+# Every possible 10-block bar, indexed by the number of filled blocks
+_BARS = tuple("▓" * filled + "░" * (10 - filled) for filled in range(11))
+
+# Most individual bets listed in the detailed bet list; the rest are counted
+DETAILED_BET_LIST_LIMIT = 25
+
 
 class MessageFormatter:
     """Handles formatting of live betting messages."""
@@ -29,8 +42,10 @@ class MessageFormatter:
         if total_pot == 0:
             return "░" * bar_length
 
-        percentage = (current_amount / total_pot) * 100
-        num_blocks = math.ceil(percentage / (100 / bar_length))
+        # Ceiling division, so any non-zero share shows at least one block
+        num_blocks = -(-current_amount * bar_length // total_pot)
+        if bar_length == 10:
+            return _BARS[num_blocks]  # Default length: reuse the prebuilt bars
         return "▓" * num_blocks + "░" * (bar_length - num_blocks)
 
     @staticmethod
@@ -41,12 +56,11 @@ class MessageFormatter:
         seconds = display_remaining_time % 60
 
         if total_duration <= 0:
-            progress_bar = "░░░░░░░░░░"
+            progress_bar = _BARS[0]
         else:
             elapsed_time = total_duration - display_remaining_time
-            elapsed_percentage = (elapsed_time / total_duration) * 100
-            num_blocks = math.floor(elapsed_percentage / 10)
-            progress_bar = "▓" * num_blocks + "░" * (10 - num_blocks)
+            num_blocks = 10 * elapsed_time // total_duration
+            progress_bar = _BARS[min(max(num_blocks, 0), 10)]
 
         # Enhanced timer with more prominent display
         if display_remaining_time > 60:
@@ -70,20 +84,28 @@ class MessageFormatter:
     ) -> str:
         """Formats the betting summary section."""
         summary = []
-        total_pot = sum(bet["amount"] for bet in bets.values())
+
+        # Group bets by contestant and total them in a single pass
+        contestant_ids: Dict[str, str] = {}
+        for c_id, c_name in contestants.items():
+            contestant_ids.setdefault(c_name.lower(), c_id)
+        contestant_bets: Dict[str, List[Tuple[str, BetInfo]]] = {
+            c_id: [] for c_id in contestants
+        }
+        contestant_totals = dict.fromkeys(contestants, 0)
+        total_pot = 0
+        for user_id, bet_info in bets.items():
+            total_pot += bet_info["amount"]
+            c_id = contestant_ids.get(bet_info["choice"])
+            if c_id is not None:
+                contestant_bets[c_id].append((user_id, bet_info))
+                contestant_totals[c_id] += bet_info["amount"]
 
         if total_pot > 0:
             summary.append(f"💰 **{total_pot}** coins total\n\n")
 
-        contestant_bets: Dict[str, List[BetInfo]] = {c_id: [] for c_id in contestants}
-        for user_id, bet_info in bets.items():
-            for c_id, c_name in contestants.items():
-                if bet_info["choice"] == c_name.lower():
-                    contestant_bets[c_id].append(bet_info)
-                    break
-
         for c_id, c_name in contestants.items():
-            total_for_contestant = sum(b["amount"] for b in contestant_bets[c_id])
+            total_for_contestant = contestant_totals[c_id]
             num_bettors = len(contestant_bets[c_id])
             bet_bar = MessageFormatter._generate_bet_progress_bar(
                 total_for_contestant, total_pot
@@ -107,18 +129,17 @@ class MessageFormatter:
                 )
 
                 # Show individual bets in compact format (max 3, then "and X
-                # more")
-                sorted_bets = sorted(
-                    contestant_bets[c_id], key=lambda x: x["amount"], reverse=True
+                # more"). nlargest keeps sorted()'s order for equal amounts
+                # without sorting every bet on each render.
+                shown_bets = heapq.nlargest(
+                    3, contestant_bets[c_id], key=lambda x: x[1]["amount"]
                 )
-                shown_bets = sorted_bets[:3]
-                for bet_info in shown_bets:
-                    user_id = next(uid for uid, b in bets.items() if b == bet_info)
+                for user_id, bet_info in shown_bets:
                     user_name = user_names.get(user_id, f"Unknown User ({user_id})")
                     summary.append(f"  •  **{user_name}** `{bet_info['amount']}`")
 
-                if len(sorted_bets) > 3:
-                    summary.append(f"  •  *and {len(sorted_bets) - 3} more...*")
+                if num_bettors > 3:
+                    summary.append(f"  •  *and {num_bettors - 3} more...*")
 
                 summary.append("\n")
 
@@ -178,18 +199,29 @@ class MessageFormatter:
             return ""
 
         detailed_list = ["\n**Individual Bets:**\n"]
-        sorted_bets = sorted(
-            bets.items(), key=lambda item: item[1]["amount"], reverse=True
+        # Only the largest bets are listed, so large rounds stay within the
+        # embed size limit without sorting every bet
+        sorted_bets = heapq.nlargest(
+            DETAILED_BET_LIST_LIMIT, bets.items(), key=lambda item: item[1]["amount"]
         )
 
         for user_id, bet_info in sorted_bets:
             user_name = user_names.get(user_id, f"Unknown User ({user_id})")
-            bet_line = f"> {user_name}: {
-                bet_info['choice'].capitalize()} - `{
-                bet_info['amount']}` coins"
-            if winnings_info and user_id in winnings_info:
-                bet_line += f" (Won: `{winnings_info[user_id]}` coins)"
-            detailed_list.append(f"{bet_line}\n")
+            won = (
+                f" (Won: `{winnings_info[user_id]}` coins)"
+                if winnings_info and user_id in winnings_info
+                else ""
+            )
+            # Build each line in one f-string rather than concatenating parts
+            detailed_list.append(
+                f"> {user_name}: {bet_info['choice'].capitalize()} - "
+                f"`{bet_info['amount']}` coins{won}\n"
+            )
+
+        if len(bets) > DETAILED_BET_LIST_LIMIT:
+            detailed_list.append(
+                f"> …and {len(bets) - DETAILED_BET_LIST_LIMIT} more bettors.\n"
+            )
 
         return "".join(detailed_list)
 
@@ -213,23 +245,19 @@ class MessageFormatter:
         if winner_info:
             # Get all user results and calculate totals
             user_results = winner_info.get("user_results", {})
-            # Calculate total pot directly from bets
-            total_pot = sum(bet["amount"] for bet in betting_session["bets"].values())
+            winner_lower = winner_info["name"].lower()
+            winner_id = find_contestant_id(betting_session["contestants"], winner_lower)
             total_bettors = len(betting_session["bets"])
 
-            # Find bets placed on the winning contestant
-            bets_on_winner = sum(
-                1
-                for bet in betting_session["bets"].values()
-                if bet["choice"].lower() == winner_info["name"].lower()
-            )
-
-            # Calculate winning pot (amount bet on winner)
-            winning_pot = sum(
-                bet["amount"]
-                for bet in betting_session["bets"].values()
-                if bet["choice"].lower() == winner_info["name"].lower()
-            )
+            # Total pot, plus count and amount of bets on the winner, in one pass
+            total_pot = 0
+            bets_on_winner = 0
+            winning_pot = 0
+            for bet in betting_session["bets"].values():
+                total_pot += bet["amount"]
+                if bet_is_on(bet, winner_id, winner_lower):
+                    bets_on_winner += 1
+                    winning_pot += bet["amount"]
 
             if bets_on_winner == 0:
                 embed_title = f"💸 {winner_info['name']} Wins!"
@@ -273,7 +301,7 @@ class MessageFormatter:
                 bet_amount = bet_info["amount"]
                 bet_choice = bet_info["choice"]
 
-                if bet_choice.lower() == winner_info["name"].lower():
+                if bet_choice.lower() == winner_lower:
                     # Winner gets their winnings (total pot)
                     description_parts.append(
                         f"> 🏆 **{user_name}** +`{bet_amount}` coins\n"
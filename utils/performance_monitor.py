@@ -5,8 +5,8 @@ Performance monitoring and health check system.
 import time
 import asyncio
 from dataclasses import dataclass, field
+from functools import wraps
 from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
 from collections import deque
 
 from utils.logger import logger
@@ -20,13 +20,13 @@ except ImportError:
     logger.warning("psutil not available - system metrics will be limited")
 
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetric:
     """Individual performance measurement."""
 
     name: str
     value: float
-    timestamp: datetime
+    timestamp: float  # time.monotonic() when recorded
     tags: Dict[str, str] = field(default_factory=dict)
 
 
@@ -46,37 +46,61 @@ class PerformanceMonitor:
     def __init__(self, max_metrics: int = 1000):
         self.metrics: deque = deque(maxlen=max_metrics)
         self.command_times: Dict[str, deque] = {}
-        self.start_time = datetime.now()
+        # Running sum of each command's windowed times, for O(1) averages
+        self.command_time_totals: Dict[str, float] = {}
+        # When each "error.*" metric was recorded, oldest first, so the
+        # health check counts errors without scanning every metric
+        self.error_timestamps: deque = deque(maxlen=256)
+        self.start_time = time.monotonic()
         self.health_checks = {}
 
+        # One process handle for all system metrics. cpu_percent() measures
+        # since its previous call, so prime it here for a meaningful first read.
+        self._process = None
+        if PSUTIL_AVAILABLE:
+            self._process = psutil.Process()
+            self._process.cpu_percent(None)
+
     def record_metric(
         self, name: str, value: float, tags: Optional[Dict[str, str]] = None
     ):
         """Record a performance metric."""
         metric = PerformanceMetric(
-            name=name, value=value, timestamp=datetime.now(), tags=tags or {}
+            name=name, value=value, timestamp=time.monotonic(), tags=tags or {}
         )
         self.metrics.append(metric)
+        if name.startswith("error."):
+            self.error_timestamps.append(metric.timestamp)
+
+    def record_error(self, kind: str):
+        """Record one occurrence of an error of the given kind."""
+        self.record_metric(f"error.{kind}", 1)
 
     def record_command_time(self, command: str, execution_time: float):
         """Record command execution time."""
-        if command not in self.command_times:
-            self.command_times[command] = deque(maxlen=100)
-
-        self.command_times[command].append(execution_time)
+        times = self.command_times.get(command)
+        if times is None:
+            times = self.command_times[command] = deque(maxlen=100)
+            self.command_time_totals[command] = 0.0
+
+        # Keep the running total in step with the window: drop the time the
+        # full deque is about to evict before adding the new one
+        if len(times) == times.maxlen:
+            self.command_time_totals[command] -= times[0]
+        times.append(execution_time)
+        self.command_time_totals[command] += execution_time
         self.record_metric(f"command.{command}.time", execution_time)
 
     def get_command_stats(self, command: str) -> Optional[Dict[str, float]]:
         """Get statistics for a specific command."""
-        if command not in self.command_times:
-            return None
-
-        times = list(self.command_times[command])
+        times = self.command_times.get(command)
         if not times:
             return None
 
+        # Read the bounded window in place rather than copying it to a list;
+        # the average comes from the running total
         return {
-            "avg_time": sum(times) / len(times),
+            "avg_time": self.command_time_totals[command] / len(times),
             "min_time": min(times),
             "max_time": max(times),
             "total_calls": len(times),
@@ -84,23 +108,18 @@ class PerformanceMonitor:
 
     def get_system_metrics(self) -> Dict[str, float]:
         """Get current system performance metrics."""
-        if not PSUTIL_AVAILABLE:
+        process = self._process
+        if process is None:
             return {
-                "uptime_hours": (datetime.now() - self.start_time).total_seconds()
-                / 3600,
+                "uptime_hours": (time.monotonic() - self.start_time) / 3600,
             }
 
         try:
-            import psutil  # Import here to avoid unbound variable
-
-            process = psutil.Process()
-
             metrics = {
                 "cpu_percent": process.cpu_percent(),
                 "memory_mb": process.memory_info().rss / 1024 / 1024,
                 "memory_percent": process.memory_percent(),
-                "uptime_hours": (datetime.now() - self.start_time).total_seconds()
-                / 3600,
+                "uptime_hours": (time.monotonic() - self.start_time) / 3600,
                 "thread_count": process.num_threads(),
             }
 
@@ -141,30 +160,27 @@ class PerformanceMonitor:
         slow_commands = []
         for command, times in self.command_times.items():
             if times:
-                avg_time = sum(times) / len(times)
+                avg_time = self.command_time_totals[command] / len(times)
                 if avg_time > 5.0:  # Commands taking >5 seconds
                     slow_commands.append(f"{command} ({avg_time:.2f}s avg)")
 
         if slow_commands:
             warnings.extend([f"Slow command: {cmd}" for cmd in slow_commands])
 
-        # Check for recent errors
-        recent_errors = [
-            m
-            for m in self.metrics
-            if m.name.startswith("error.")
-            and m.timestamp > datetime.now() - timedelta(minutes=10)
-        ]
-
-        if len(recent_errors) > 10:
-            issues.append(
-                f"High error rate: {
-                    len(recent_errors)} errors in 10 minutes"
-            )
-        elif len(recent_errors) > 5:
+        # Count errors from the last 10 minutes. Error timestamps are in time
+        # order, so walk back from the newest and stop at the cutoff.
+        cutoff = time.monotonic() - 600
+        recent_errors = 0
+        for timestamp in reversed(self.error_timestamps):
+            if timestamp <= cutoff:
+                break
+            recent_errors += 1
+
+        if recent_errors > 10:
+            issues.append(f"High error rate: {recent_errors} errors in 10 minutes")
+        elif recent_errors > 5:
             warnings.append(
-                f"Elevated error rate: {
-                    len(recent_errors)} errors in 10 minutes"
+                f"Elevated error rate: {recent_errors} errors in 10 minutes"
             )
 
         return HealthStatus(
@@ -176,8 +192,15 @@ class PerformanceMonitor:
 
     def get_performance_summary(self, hours: int = 1) -> Dict[str, Any]:
         """Get performance summary for the last N hours."""
-        cutoff = datetime.now() - timedelta(hours=hours)
-        recent_metrics = [m for m in self.metrics if m.timestamp >= cutoff]
+        cutoff = time.monotonic() - hours * 3600
+        # Metrics are appended in time order: walk back from the newest and
+        # stop at the cutoff instead of filtering the whole buffer
+        recent_metrics = []
+        for metric in reversed(self.metrics):
+            if metric.timestamp < cutoff:
+                break
+            recent_metrics.append(metric)
+        recent_metrics.reverse()
 
         # Group metrics by name
         metric_groups = {}
@@ -211,25 +234,29 @@ def performance_timer(monitor: PerformanceMonitor, command_name: str):
     """Decorator to automatically time command execution."""
 
     def decorator(func):
-        async def async_wrapper(*args, **kwargs):
-            start_time = time.time()
-            try:
-                result = await func(*args, **kwargs)
-                return result
-            finally:
-                execution_time = time.time() - start_time
-                monitor.record_command_time(command_name, execution_time)
+        record = monitor.record_command_time
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start_time = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    record(command_name, time.perf_counter() - start_time)
+
+            return async_wrapper
 
+        @wraps(func)
         def sync_wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
-                result = func(*args, **kwargs)
-                return result
+                return func(*args, **kwargs)
             finally:
-                execution_time = time.time() - start_time
-                monitor.record_command_time(command_name, execution_time)
+                record(command_name, time.perf_counter() - start_time)
 
-        return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+        return sync_wrapper
 
     return decorator
 